@@ -6,16 +6,103 @@ of satellites orbiting Earth, allowing users to visualize orbital motion
 in real-time.
 """
 
+from functools import lru_cache
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
-from satellite import Satellite
+from satellite import Satellite, SatelliteArray, MU_EARTH, EARTH_RADIUS_KM
+from trajectory_plotter import TrajectoryPlotter
 
 # Set animation embed limit to allow larger animations (100MB)
 matplotlib.rcParams['animation.embed_limit'] = 100
 
+# Upper bound on vertices drawn per trail; longer trails are strided
+MAX_TRAIL_POINTS = 32
+
+# Matplotlib cannot redraw 3D axes much faster than this, so higher playback
+# rates skip simulation frames instead of rendering them
+MAX_RENDER_FPS = 20
+
+# Points along each direction of the Earth mesh; a coarse sphere is enough
+# behind moving markers and keeps every redraw cheap
+EARTH_MESH_POINTS = 25
+
+
+def _plot_earth(ax, alpha):
+    """
+    Draw the Earth sphere on a 3D axis.
+    
+    Reuses the mesh cached by TrajectoryPlotter, so it is built once and
+    shared by every animation and plot.
+    
+    Args:
+        ax: Matplotlib 3D axis to draw on
+        alpha (float): Opacity of the sphere
+    """
+    x_earth, y_earth, z_earth = TrajectoryPlotter._get_earth_mesh(n=EARTH_MESH_POINTS)
+    ax.plot_surface(x_earth, y_earth, z_earth, alpha=alpha,
+                    color='lightblue', edgecolor='none')
+
+
+def _orbit_key(satellite):
+    """
+    Return the orbital elements that fully determine a satellite's positions.
+    
+    The tuple is ordered like the Satellite constructor arguments that
+    follow name and satellite_id.
+    """
+    return (satellite.inclination, satellite.eccentricity, satellite.semi_major_axis,
+            satellite.mean_anomaly, satellite.epoch, satellite.raan,
+            satellite.argument_of_perigee)
+
+
+@lru_cache(maxsize=32)
+def _cached_positions(orbit_key, total_seconds, num_frames):
+    """
+    Propagate an orbit over evenly spaced animation frames, with memoization.
+    
+    Replaying an animation, or animating the same orbit twice, reuses the
+    positions computed the first time.
+    
+    Args:
+        orbit_key (tuple): Orbital elements from _orbit_key
+        total_seconds (float): Simulated time span in seconds
+        num_frames (int): Number of evenly spaced frames from 0 to total_seconds
+    
+    Returns:
+        numpy.ndarray: Read-only array of shape (num_frames, 3) with ECI positions
+    """
+    satellite = Satellite('cached', 'cached', *orbit_key)
+    times = np.linspace(0, total_seconds, num_frames)
+    positions = satellite.calculate_positions(times)
+    positions.setflags(write=False)  # Shared between callers
+    return positions
+
+
+@lru_cache(maxsize=8)
+def _cached_batch_positions(orbit_keys, total_seconds, num_frames):
+    """
+    Propagate several orbits over the same animation frames, with memoization.
+    
+    Batched counterpart of _cached_positions: replaying a multi-satellite
+    animation reuses the positions computed the first time.
+    
+    Args:
+        orbit_keys (tuple): One _orbit_key tuple per satellite
+        total_seconds (float): Simulated time span in seconds
+        num_frames (int): Number of evenly spaced frames from 0 to total_seconds
+    
+    Returns:
+        numpy.ndarray: Read-only array of shape (S, num_frames, 3) with ECI positions
+    """
+    satellites = [Satellite('cached', 'cached', *key) for key in orbit_keys]
+    times = np.linspace(0, total_seconds, num_frames)
+    positions = SatelliteArray(satellites).propagate(times)
+    positions.setflags(write=False)  # Shared between callers
+    return positions
+
 
 def create_orbit_animation(satellite, simulation_hours=2, fps=30, trail_length=50):
     """
@@ -43,8 +130,7 @@ def create_orbit_animation(satellite, simulation_hours=2, fps=30, trail_length=5
         raise ValueError("simulation_hours must be positive")
     
     # Calculate orbital period to determine appropriate time step
-    mu = 398600.4418  # Earth gravitational parameter
-    orbital_period = 2 * np.pi * np.sqrt(satellite.semi_major_axis**3 / mu)
+    orbital_period = 2 * np.pi * np.sqrt(satellite.semi_major_axis**3 / MU_EARTH)
     orbital_period_minutes = orbital_period / 60
     
     # Calculate total simulation time
@@ -91,10 +177,16 @@ def create_orbit_animation(satellite, simulation_hours=2, fps=30, trail_length=5
         actual_fps = 30
         target_playback_seconds = num_frames / actual_fps
     
+    # Render at most MAX_RENDER_FPS; the full-rate trajectory is kept for the
+    # trail and telemetry, and rendered frames sample it evenly
+    render_fps = min(actual_fps, MAX_RENDER_FPS)
+    render_frames = max(1, min(num_frames, int(render_fps * target_playback_seconds)))
+    frame_indices = np.linspace(0, num_frames - 1, render_frames).astype(np.int64)
+    
     # Pre-calculate all positions for smooth animation
     # Times array represents actual simulation time from 0 to total_seconds
     times = np.linspace(0, total_seconds, num_frames)
-    positions = np.array([satellite.calculate_position(t) for t in times])
+    positions = _cached_positions(_orbit_key(satellite), total_seconds, num_frames)
     
     # Create figure and 3D axis
     fig = plt.figure(figsize=(12, 10))
@@ -106,29 +198,20 @@ def create_orbit_animation(satellite, simulation_hours=2, fps=30, trail_length=5
     ax.set_ylim([-max_range, max_range])
     ax.set_zlim([-max_range, max_range])
     
-    # Create Earth sphere
-    earth_radius = 6371  # km
-    u_earth = np.linspace(0, 2 * np.pi, 50)
-    v_earth = np.linspace(0, np.pi, 50)
-    x_earth = earth_radius * np.outer(np.cos(u_earth), np.sin(v_earth))
-    y_earth = earth_radius * np.outer(np.sin(u_earth), np.sin(v_earth))
-    z_earth = earth_radius * np.outer(np.ones(np.size(u_earth)), np.cos(v_earth))
-    
     # Plot Earth
-    ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.6, 
-                   color='lightblue', edgecolor='none')
+    _plot_earth(ax, alpha=0.6)
     
     # Plot full orbital path (faint)
     full_orbit_times = np.linspace(0, orbital_period, 500)
-    full_orbit_positions = np.array([satellite.calculate_position(t) for t in full_orbit_times])
+    full_orbit_positions = satellite.calculate_positions(full_orbit_times)
     ax.plot(full_orbit_positions[:, 0], full_orbit_positions[:, 1], 
             full_orbit_positions[:, 2], 'gray', alpha=0.3, linewidth=1, 
             label='Orbital Path')
     
     # Initialize satellite marker and trail
     satellite_marker, = ax.plot([], [], [], 'ro', markersize=10, 
-                                label=satellite.name, zorder=5)
-    trail_line, = ax.plot([], [], [], 'r-', linewidth=2, alpha=0.7)
+                                label=satellite.name, zorder=5, animated=True)
+    trail_line, = ax.plot([], [], [], 'r-', linewidth=2, alpha=0.7, animated=True)
     
     # Set labels and title
     ax.set_xlabel('X (km)', fontsize=11, fontweight='bold')
@@ -137,66 +220,80 @@ def create_orbit_animation(satellite, simulation_hours=2, fps=30, trail_length=5
     
     # Time display text
     time_text = ax.text2D(0.02, 0.95, '', transform=ax.transAxes, fontsize=12,
-                         fontweight='bold', color='darkblue')
+                         fontweight='bold', color='darkblue', animated=True)
     info_text = ax.text2D(0.02, 0.90, '', transform=ax.transAxes, fontsize=10,
-                         color='darkgreen')
+                         color='darkgreen', animated=True)
     
     ax.legend(loc='upper right', fontsize=10)
     
+    # Title and the static part of the info text do not change per frame
+    ax.set_title(f'{satellite.name} Orbit Animation\n'
+                f'Simulation: {simulation_hours:.1f}h ({num_orbits:.1f} orbits) | '
+                f'Orbital Period: {orbital_period_minutes:.1f} min',
+                fontsize=14, fontweight='bold')
+    
+    # Per-frame telemetry depends only on the precomputed positions and times
+    altitude_arr = np.sqrt((positions**2).sum(axis=1)) - EARTH_RADIUS_KM
+    orbits_arr = times / orbital_period
+    secs_int = times.astype(np.int64)
+    hours_arr = secs_int // 3600
+    minutes_arr = (secs_int % 3600) // 60
+    seconds_arr = secs_int % 60
+    time_fmt = 'Simulation Time: {:02d}h {:02d}m {:02d}s'.format
+    info_fmt = ('Altitude: {:.1f} km | Orbits: {:.2f} / ' + f'{num_orbits:.2f}').format
+    
+    # Fixed camera: with blitting the static background (Earth, orbital path,
+    # axes) is cached, so the view cannot rotate between frames
+    ax.view_init(elev=20, azim=30)
+    
     def init():
         """Initialize animation."""
-        satellite_marker.set_data([], [])
-        satellite_marker.set_3d_properties([])
-        trail_line.set_data([], [])
-        trail_line.set_3d_properties([])
+        satellite_marker.set_data_3d([], [], [])
+        trail_line.set_data_3d([], [], [])
         time_text.set_text('')
         info_text.set_text('')
         return satellite_marker, trail_line, time_text, info_text
     
-    def animate(frame):
+    # Hot references are bound as default arguments so the per-frame callback
+    # reads them as fast locals instead of closure cells
+    def animate(render_frame, frame_indices=frame_indices, positions=positions,
+                satellite_marker=satellite_marker, trail_line=trail_line,
+                time_text=time_text, info_text=info_text,
+                time_fmt=time_fmt, info_fmt=info_fmt, hours_arr=hours_arr,
+                minutes_arr=minutes_arr, seconds_arr=seconds_arr,
+                altitude_arr=altitude_arr, orbits_arr=orbits_arr,
+                trail_length=trail_length, max_trail_points=MAX_TRAIL_POINTS):
         """Update animation frame."""
+        frame = frame_indices[render_frame]
         # Current position
         x, y, z = positions[frame]
         
         # Update satellite marker
-        satellite_marker.set_data([x], [y])
-        satellite_marker.set_3d_properties([z])
+        satellite_marker.set_data_3d([x], [y], [z])
         
         # Update trail (last trail_length positions)
-        start_idx = max(0, frame - trail_length)
-        trail_x = positions[start_idx:frame+1, 0]
-        trail_y = positions[start_idx:frame+1, 1]
-        trail_z = positions[start_idx:frame+1, 2]
-        trail_line.set_data(trail_x, trail_y)
-        trail_line.set_3d_properties(trail_z)
+        # Stride is aligned so the trail always ends at the current frame,
+        # and keeps it to span // step + 1 <= max_trail_points vertices
+        span = min(frame, trail_length)
+        step = max(1, (span + max_trail_points - 2) // (max_trail_points - 1))
+        start_idx = frame - (span // step) * step
+        trail_x = positions[start_idx:frame+1:step, 0]
+        trail_y = positions[start_idx:frame+1:step, 1]
+        trail_z = positions[start_idx:frame+1:step, 2]
+        trail_line.set_data_3d(trail_x, trail_y, trail_z)
         
         # Update time display - shows actual simulation time
-        current_time = times[frame]
-        hours = int(current_time // 3600)
-        minutes = int((current_time % 3600) // 60)
-        seconds = int(current_time % 60)
-        time_text.set_text(f'Simulation Time: {hours:02d}h {minutes:02d}m {seconds:02d}s')
-        
-        # Calculate orbits completed and current altitude
-        orbits_completed = current_time / orbital_period
-        distance = np.sqrt(x**2 + y**2 + z**2)
-        altitude = distance - earth_radius
-        info_text.set_text(f'Altitude: {altitude:.1f} km | Orbits: {orbits_completed:.2f} / {num_orbits:.2f}')
-        
-        # Update title with orbital period information
-        ax.set_title(f'{satellite.name} Orbit Animation\n'
-                    f'Simulation: {simulation_hours:.1f}h ({num_orbits:.1f} orbits) | '
-                    f'Orbital Period: {orbital_period_minutes:.1f} min',
-                    fontsize=14, fontweight='bold')
+        time_text.set_text(time_fmt(hours_arr[frame], minutes_arr[frame], seconds_arr[frame]))
         
-        # Rotate view slightly for dynamic effect
-        ax.view_init(elev=20, azim=(30 + frame * 0.1) % 360)
+        # Orbits completed and current altitude
+        info_text.set_text(info_fmt(altitude_arr[frame], orbits_arr[frame]))
         
         return satellite_marker, trail_line, time_text, info_text
     
     # Create animation with adjusted fps
-    anim = FuncAnimation(fig, animate, init_func=init, frames=num_frames,
-                        interval=1000/actual_fps, blit=False, repeat=True)
+    anim = FuncAnimation(fig, animate, init_func=init, frames=render_frames,
+                        interval=1000 * target_playback_seconds / render_frames,
+                        blit=True, repeat=True)
     
     plt.tight_layout()
     return anim, fig
@@ -219,12 +316,11 @@ def create_multi_satellite_animation(satellites, simulation_hours=2, fps=30, tra
         raise ValueError("At least one satellite must be provided")
     
     # Calculate simulation parameters with orbital period-based frame sampling
-    mu = 398600.4418  # Earth gravitational parameter
     total_seconds = simulation_hours * 3600
     
     # Calculate average orbital period for all satellites (use first satellite as reference)
     # For multi-satellite, we'll use the average orbital period
-    avg_orbital_period = np.mean([2 * np.pi * np.sqrt(sat.semi_major_axis**3 / mu) 
+    avg_orbital_period = np.mean([2 * np.pi * np.sqrt(sat.semi_major_axis**3 / MU_EARTH) 
                                    for sat in satellites])
     avg_orbital_period_minutes = avg_orbital_period / 60
     
@@ -263,13 +359,25 @@ def create_multi_satellite_animation(satellites, simulation_hours=2, fps=30, tra
         actual_fps = 30
         target_playback_seconds = num_frames / actual_fps
     
+    # Render at most MAX_RENDER_FPS; the full-rate trajectory is kept for the
+    # trail and telemetry, and rendered frames sample it evenly
+    render_fps = min(actual_fps, MAX_RENDER_FPS)
+    render_frames = max(1, min(num_frames, int(render_fps * target_playback_seconds)))
+    frame_indices = np.linspace(0, num_frames - 1, render_frames).astype(np.int64)
+    
     # Times array represents actual simulation time from 0 to total_seconds
     times = np.linspace(0, total_seconds, num_frames)
     
-    # Pre-calculate all positions for all satellites
-    all_positions = {}
-    for sat in satellites:
-        all_positions[sat.name] = np.array([sat.calculate_position(t) for t in times])
+    # Pre-calculate all positions for all satellites in one batched (and
+    # memoized) call, giving positions of shape (S, N, 3)
+    orbit_keys = tuple(_orbit_key(sat) for sat in satellites)
+    positions = _cached_batch_positions(orbit_keys, total_seconds, num_frames)
+    
+    # Store x/y/z as contiguous (S, N) planes so each satellite's coordinates
+    # are row views and trail slices are plain 1-D views
+    xs_all, ys_all, zs_all = np.moveaxis(positions, -1, 0).copy()
+    all_positions = {sat.name: (xs_all[idx], ys_all[idx], zs_all[idx])
+                     for idx, sat in enumerate(satellites)}
     
     # Create figure
     fig = plt.figure(figsize=(14, 11))
@@ -282,15 +390,8 @@ def create_multi_satellite_animation(satellites, simulation_hours=2, fps=30, tra
     ax.set_ylim([-max_range, max_range])
     ax.set_zlim([-max_range, max_range])
     
-    # Create Earth
-    earth_radius = 6371
-    u_earth = np.linspace(0, 2 * np.pi, 50)
-    v_earth = np.linspace(0, np.pi, 50)
-    x_earth = earth_radius * np.outer(np.cos(u_earth), np.sin(v_earth))
-    y_earth = earth_radius * np.outer(np.sin(u_earth), np.sin(v_earth))
-    z_earth = earth_radius * np.outer(np.ones(np.size(u_earth)), np.cos(v_earth))
-    ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.5, 
-                   color='lightblue', edgecolor='none')
+    # Plot Earth
+    _plot_earth(ax, alpha=0.5)
     
     # Colors for different satellites
     colors = ['red', 'blue', 'green', 'orange', 'purple', 'cyan', 'magenta']
@@ -302,11 +403,16 @@ def create_multi_satellite_animation(satellites, simulation_hours=2, fps=30, tra
     for idx, sat in enumerate(satellites):
         color = colors[idx % len(colors)]
         marker, = ax.plot([], [], [], 'o', color=color, markersize=10, 
-                         label=sat.name, zorder=5)
-        trail, = ax.plot([], [], [], '-', color=color, linewidth=2, alpha=0.6)
+                         label=sat.name, zorder=5, animated=True)
+        trail, = ax.plot([], [], [], '-', color=color, linewidth=2, alpha=0.6,
+                        animated=True)
         markers[sat.name] = marker
         trails[sat.name] = trail
     
+    # Resolve per-satellite lookups once, outside the animation callback
+    sat_artists = [(markers[sat.name], trails[sat.name]) + all_positions[sat.name]
+                   for sat in satellites]
+    
     # Labels
     ax.set_xlabel('X (km)', fontsize=11, fontweight='bold')
     ax.set_ylabel('Y (km)', fontsize=11, fontweight='bold')
@@ -314,56 +420,64 @@ def create_multi_satellite_animation(satellites, simulation_hours=2, fps=30, tra
     ax.legend(loc='upper right', fontsize=10)
     
     time_text = ax.text2D(0.02, 0.95, '', transform=ax.transAxes, fontsize=12,
-                         fontweight='bold', color='darkblue')
+                         fontweight='bold', color='darkblue', animated=True)
+    
+    # Title does not change per frame
+    ax.set_title(f'Multi-Satellite Orbit Animation\n'
+                f'Simulation: {simulation_hours:.1f}h ({num_orbits:.1f} orbits) | '
+                f'Satellites: {len(satellites)} | Avg Period: {avg_orbital_period_minutes:.1f} min',
+                fontsize=14, fontweight='bold')
+    
+    # Fixed camera: with blitting the static background (Earth, axes) is
+    # cached, so the view cannot rotate between frames
+    ax.view_init(elev=20, azim=30)
+    
+    # Per-frame simulation clock depends only on the precomputed times
+    secs_int = times.astype(np.int64)
+    hours_arr = secs_int // 3600
+    minutes_arr = (secs_int % 3600) // 60
+    seconds_arr = secs_int % 60
+    time_fmt = 'Simulation Time: {:02d}h {:02d}m {:02d}s'.format
+    
+    animated_artists = list(markers.values()) + list(trails.values()) + [time_text]
     
     def init():
-        for sat in satellites:
-            markers[sat.name].set_data([], [])
-            markers[sat.name].set_3d_properties([])
-            trails[sat.name].set_data([], [])
-            trails[sat.name].set_3d_properties([])
+        for marker, trail, _, _, _ in sat_artists:
+            marker.set_data_3d([], [], [])
+            trail.set_data_3d([], [], [])
         time_text.set_text('')
-        return list(markers.values()) + list(trails.values()) + [time_text]
-    
-    def animate(frame):
-        for sat in satellites:
-            positions = all_positions[sat.name]
-            x, y, z = positions[frame]
-            
+        return animated_artists
+    
+    # Hot references are bound as default arguments so the per-frame callback
+    # reads them as fast locals instead of closure cells
+    def animate(render_frame, frame_indices=frame_indices, sat_artists=sat_artists,
+                time_text=time_text, time_fmt=time_fmt, hours_arr=hours_arr,
+                minutes_arr=minutes_arr, seconds_arr=seconds_arr,
+                animated_artists=animated_artists, trail_length=trail_length,
+                max_trail_points=MAX_TRAIL_POINTS):
+        frame = frame_indices[render_frame]
+        # Stride is aligned so each trail always ends at the current frame,
+        # and keeps it to span // step + 1 <= max_trail_points vertices
+        span = min(frame, trail_length)
+        step = max(1, (span + max_trail_points - 2) // (max_trail_points - 1))
+        start_idx = frame - (span // step) * step
+        for marker, trail, xs, ys, zs in sat_artists:
             # Update marker
-            markers[sat.name].set_data([x], [y])
-            markers[sat.name].set_3d_properties([z])
+            marker.set_data_3d([xs[frame]], [ys[frame]], [zs[frame]])
             
             # Update trail
-            start_idx = max(0, frame - trail_length)
-            trail_x = positions[start_idx:frame+1, 0]
-            trail_y = positions[start_idx:frame+1, 1]
-            trail_z = positions[start_idx:frame+1, 2]
-            trails[sat.name].set_data(trail_x, trail_y)
-            trails[sat.name].set_3d_properties(trail_z)
+            trail_slice = slice(start_idx, frame + 1, step)
+            trail.set_data_3d(xs[trail_slice], ys[trail_slice], zs[trail_slice])
         
         # Update time - shows actual simulation time
-        current_time = times[frame]
-        hours = int(current_time // 3600)
-        minutes = int((current_time % 3600) // 60)
-        seconds = int(current_time % 60)
-        time_text.set_text(f'Simulation Time: {hours:02d}h {minutes:02d}m {seconds:02d}s')
-        
-        # Calculate orbits completed (using average orbital period)
-        orbits_completed = current_time / avg_orbital_period
-        
-        ax.set_title(f'Multi-Satellite Orbit Animation\n'
-                    f'Simulation: {simulation_hours:.1f}h ({num_orbits:.1f} orbits) | '
-                    f'Satellites: {len(satellites)} | Avg Period: {avg_orbital_period_minutes:.1f} min',
-                    fontsize=14, fontweight='bold')
-        
-        ax.view_init(elev=20, azim=(30 + frame * 0.1) % 360)
+        time_text.set_text(time_fmt(hours_arr[frame], minutes_arr[frame], seconds_arr[frame]))
         
-        return list(markers.values()) + list(trails.values()) + [time_text]
+        return animated_artists
     
     # Create animation with adjusted fps
-    anim = FuncAnimation(fig, animate, init_func=init, frames=num_frames,
-                        interval=1000/actual_fps, blit=False, repeat=True)
+    anim = FuncAnimation(fig, animate, init_func=init, frames=render_frames,
+                        interval=1000 * target_playback_seconds / render_frames,
+                        blit=True, repeat=True)
     
     plt.tight_layout()
     return anim, fig
@@ -389,7 +503,7 @@ def interactive_satellite_selector(satellites_data):
             altitude = sat.get_altitude()
         else:
             name = sat.get('name', 'Unknown')
-            altitude = sat.get('semi_major_axis', 6778) - 6371
+            altitude = sat.get('semi_major_axis', 6778) - EARTH_RADIUS_KM
         print(f"  {idx}. {name} (Altitude: {altitude:.1f} km)")
     
     print("=" * 50)
@@ -6,23 +6,40 @@ and write results to output files.
 """
 
 import csv
-from datetime import datetime
 from typing import List, Dict, Optional
-from satellite import Satellite
+import numpy as np
+import pandas as pd
+from satellite import Satellite, EARTH_RADIUS_KM
 
 
-def read_satellite_data_from_file(filename):
+# Orbital element fields of the structured array returned by
+# read_satellite_array_from_file (string fields are sized to the data)
+SATELLITE_NUMERIC_FIELDS = [
+    ('inclination', 'f8'),
+    ('eccentricity', 'f8'),
+    ('semi_major_axis', 'f8'),
+    ('mean_anomaly', 'f8'),
+    ('raan', 'f8'),
+    ('argument_of_perigee', 'f8'),
+]
+
+
+def read_satellite_array_from_file(filename):
     """
-    Read satellite data from a CSV file.
+    Read satellite data from a CSV file into a NumPy structured array.
     
     The CSV file should have the following columns:
     name, id, inclination, eccentricity, semi_major_axis, mean_anomaly, raan, argument_of_perigee, epoch
     
+    Each orbital element is stored as a contiguous column, which avoids one
+    dictionary per satellite and lets vectorized code use the columns directly.
+    
     Args:
         filename (str): Path to the CSV data file
     
     Returns:
-        list: List of dictionaries containing satellite data
+        numpy.ndarray: Structured array with fields name, id, the orbital
+                       elements in SATELLITE_NUMERIC_FIELDS and epoch (datetime64[s])
     
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -30,47 +47,61 @@ def read_satellite_data_from_file(filename):
         ValueError: If the file format is invalid
     """
     try:
-        satellites = []
-        with open(filename, 'r', encoding='utf-8') as file:
-            # Read CSV file
-            reader = csv.DictReader(file)
-            
-            # Check for required columns
-            required_columns = ['name', 'id', 'inclination', 'eccentricity', 
-                              'semi_major_axis', 'mean_anomaly', 'epoch']
-            
-            if not all(col in reader.fieldnames for col in required_columns):
-                raise ValueError(f"CSV file must contain columns: {required_columns}")
-            
-            # Process each row
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                try:
-                    # Parse epoch string to datetime
-                    epoch = datetime.strptime(row['epoch'], '%Y-%m-%d %H:%M:%S')
-                    
-                    # Get RAAN and argument_of_perigee if present, default to 0.0
-                    raan = float(row.get('raan', 0.0))
-                    argument_of_perigee = float(row.get('argument_of_perigee', 0.0))
-                    
-                    satellite_data = {
-                        'name': row['name'].strip(),
-                        'id': row['id'].strip(),
-                        'inclination': float(row['inclination']),
-                        'eccentricity': float(row['eccentricity']),
-                        'semi_major_axis': float(row['semi_major_axis']),
-                        'mean_anomaly': float(row['mean_anomaly']),
-                        'raan': raan,
-                        'argument_of_perigee': argument_of_perigee,
-                        'epoch': epoch
-                    }
-                    satellites.append(satellite_data)
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Skipping invalid row {row_num}: {e}")
-                    continue
+        # Parse the whole file in one call; cells are kept as strings so that
+        # bad values can be reported per row instead of failing the file
+        df = pd.read_csv(filename, dtype=str, keep_default_na=False, encoding='utf-8')
+        
+        # Check for required columns
+        required_columns = ['name', 'id', 'inclination', 'eccentricity', 
+                          'semi_major_axis', 'mean_anomaly', 'epoch']
+        
+        if not all(col in df.columns for col in required_columns):
+            raise ValueError(f"CSV file must contain columns: {required_columns}")
+        
+        # Vectorized conversion of the numeric columns; invalid cells become NaN
+        numeric_columns = [field for field, _ in SATELLITE_NUMERIC_FIELDS]
+        columns = {}
+        for col in numeric_columns:
+            if col in df.columns:
+                columns[col] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+            else:
+                # RAAN and argument_of_perigee are optional, default to 0.0
+                columns[col] = np.zeros(len(df))
+        
+        # Parse epoch strings to datetime; invalid cells become NaT
+        epochs = pd.to_datetime(df['epoch'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        epoch_invalid = epochs.isna().to_numpy()
         
-        if not satellites:
+        invalid = epoch_invalid.copy()
+        for values in columns.values():
+            invalid |= np.isnan(values)
+        
+        # Report invalid rows (row 1 is the header)
+        for i in np.flatnonzero(invalid):
+            bad = [col for col in numeric_columns if np.isnan(columns[col][i])]
+            if epoch_invalid[i]:
+                bad.append('epoch')
+            print(f"Warning: Skipping invalid row {i + 2}: invalid value in {', '.join(bad)}")
+        
+        valid = ~invalid
+        if not valid.any():
             raise ValueError("No valid satellite data found in file")
         
+        names = df['name'].str.strip()[valid].to_numpy(dtype=str)
+        ids = df['id'].str.strip()[valid].to_numpy(dtype=str)
+        
+        dtype = np.dtype(
+            [('name', names.dtype), ('id', ids.dtype)]
+            + SATELLITE_NUMERIC_FIELDS
+            + [('epoch', 'datetime64[s]')]
+        )
+        satellites = np.empty(int(valid.sum()), dtype=dtype)
+        satellites['name'] = names
+        satellites['id'] = ids
+        for col in numeric_columns:
+            satellites[col] = columns[col][valid]
+        satellites['epoch'] = epochs[valid].to_numpy(dtype='datetime64[s]')
+        
         return satellites
     
     except FileNotFoundError:
@@ -81,12 +112,37 @@ def read_satellite_data_from_file(filename):
         raise ValueError(f"Unexpected error reading file '{filename}': {str(e)}")
 
 
+def read_satellite_data_from_file(filename):
+    """
+    Read satellite data from a CSV file.
+    
+    The CSV file should have the following columns:
+    name, id, inclination, eccentricity, semi_major_axis, mean_anomaly, raan, argument_of_perigee, epoch
+    
+    Args:
+        filename (str): Path to the CSV data file
+    
+    Returns:
+        list: List of dictionaries containing satellite data
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        IOError: If there's an error reading the file
+        ValueError: If the file format is invalid
+    """
+    satellites = read_satellite_array_from_file(filename)
+    field_names = satellites.dtype.names
+    # tolist() converts each record to Python str/float/datetime values
+    return [dict(zip(field_names, values)) for values in satellites.tolist()]
+
+
 def create_satellite_objects(satellite_data_list):
     """
     Create Satellite objects from a list of satellite data dictionaries.
     
     Args:
-        satellite_data_list (list): List of dictionaries containing satellite data
+        satellite_data_list (list or numpy.ndarray): List of dictionaries containing
+            satellite data, or a structured array from read_satellite_array_from_file
     
     Returns:
         list: List of Satellite objects
@@ -97,23 +153,36 @@ def create_satellite_objects(satellite_data_list):
     satellites = []
     errors = []
     
-    for idx, sat_data in enumerate(satellite_data_list):
-        try:
-            sat = Satellite(
-                name=sat_data['name'],
-                satellite_id=sat_data['id'],
-                inclination=sat_data['inclination'],
-                eccentricity=sat_data['eccentricity'],
-                semi_major_axis=sat_data['semi_major_axis'],
-                mean_anomaly=sat_data['mean_anomaly'],
-                epoch=sat_data['epoch'],
-                raan=sat_data.get('raan', 0.0),
-                argument_of_perigee=sat_data.get('argument_of_perigee', 0.0)
-            )
-            satellites.append(sat)
-        except (ValueError, KeyError) as e:
-            errors.append(f"Satellite {idx + 1} ({sat_data.get('name', 'unknown')}): {e}")
-            continue
+    if isinstance(satellite_data_list, np.ndarray):
+        # Structured array from read_satellite_array_from_file: every field is
+        # present, so build each Satellite in one pass straight from the columns
+        # (in constructor order) without per-record dicts or .get defaults
+        fields = ('name', 'id', 'inclination', 'eccentricity', 'semi_major_axis',
+                  'mean_anomaly', 'epoch', 'raan', 'argument_of_perigee')
+        records = zip(*(satellite_data_list[field].tolist() for field in fields))
+        for idx, values in enumerate(records):
+            try:
+                satellites.append(Satellite(*values))
+            except ValueError as e:
+                errors.append(f"Satellite {idx + 1} ({values[0]}): {e}")
+    else:
+        for idx, sat_data in enumerate(satellite_data_list):
+            try:
+                sat = Satellite(
+                    name=sat_data['name'],
+                    satellite_id=sat_data['id'],
+                    inclination=sat_data['inclination'],
+                    eccentricity=sat_data['eccentricity'],
+                    semi_major_axis=sat_data['semi_major_axis'],
+                    mean_anomaly=sat_data['mean_anomaly'],
+                    epoch=sat_data['epoch'],
+                    raan=sat_data.get('raan', 0.0),
+                    argument_of_perigee=sat_data.get('argument_of_perigee', 0.0)
+                )
+                satellites.append(sat)
+            except (ValueError, KeyError) as e:
+                errors.append(f"Satellite {idx + 1} ({sat_data.get('name', 'unknown')}): {e}")
+                continue
     
     if errors:
         print("Warnings while creating satellites:")
@@ -130,16 +199,19 @@ def write_results_to_file(filename, data, headers=None):
     """
     Write results to a CSV file.
     
+    Rows are streamed to the file through a 1 MB write buffer, so data may be
+    a generator and does not need to be materialized as a list.
+    
     Args:
         filename (str): Output file path
-        data (list): List of data rows (each row is a list)
+        data (iterable): Iterable of data rows (each row is a sequence of values)
         headers (list, optional): List of column headers
     
     Raises:
         IOError: If there's an error writing to the file
     """
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as file:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
             writer = csv.writer(file)
             if headers:
                 writer.writerow(headers)
@@ -155,23 +227,34 @@ def write_satellite_summary_to_file(filename, satellites):
     
     Args:
         filename (str): Output file path
-        satellites (list): List of Satellite objects
+        satellites (iterable): Satellite objects (e.g. a list or a generator)
     """
     headers = ['Name', 'ID', 'Inclination (deg)', 'Eccentricity', 
                'Semi-major Axis (km)', 'Altitude (km)', 'Mean Anomaly (deg)']
     
-    data = []
-    for sat in satellites:
-        row = [
-            sat.name,
-            sat.satellite_id,
-            f"{sat.inclination:.4f}",
-            f"{sat.eccentricity:.6f}",
-            f"{sat.semi_major_axis:.2f}",
-            f"{sat.get_altitude():.2f}",
-            f"{sat.mean_anomaly:.2f}"
-        ]
-        data.append(row)
+    # The columns are collected in separate passes, so materialize one-pass iterables
+    satellites = list(satellites)
+    count = len(satellites)
+    names = [sat.name for sat in satellites]
+    ids = [sat.satellite_id for sat in satellites]
+    inclinations = np.fromiter((sat.inclination for sat in satellites), dtype=np.float64, count=count)
+    eccentricities = np.fromiter((sat.eccentricity for sat in satellites), dtype=np.float64, count=count)
+    semi_major_axes = np.fromiter((sat.semi_major_axis for sat in satellites), dtype=np.float64, count=count)
+    mean_anomalies = np.fromiter((sat.mean_anomaly for sat in satellites), dtype=np.float64, count=count)
+    
+    # Mean altitude for the whole catalog at once (same as Satellite.get_altitude)
+    altitudes = semi_major_axes - EARTH_RADIUS_KM
+    
+    # Format each column in one call instead of per-row f-strings
+    data = zip(
+        names,
+        ids,
+        np.char.mod('%.4f', inclinations),
+        np.char.mod('%.6f', eccentricities),
+        np.char.mod('%.2f', semi_major_axes),
+        np.char.mod('%.2f', altitudes),
+        np.char.mod('%.2f', mean_anomalies)
+    )
     
     write_results_to_file(filename, data, headers)
 
@@ -5,9 +5,40 @@ This module provides utility functions for calculating orbital elements
 and predicting future satellite positions.
 """
 
+from functools import lru_cache
+import math
 import numpy as np
 from datetime import datetime, timedelta
-from satellite import Satellite
+from satellite import Satellite, MU_EARTH
+
+
+@lru_cache(maxsize=1024)
+def _parse_epoch(epoch_str):
+    """
+    Parse a 'YYYY-MM-DD HH:MM:SS' epoch string.
+    
+    Canonical fixed-width strings are sliced directly, which is much faster
+    than datetime.strptime; anything else (e.g. unpadded '2024-1-1 0:0:0')
+    falls back to strptime. Results are cached because TLE batches often
+    share the same epoch.
+    
+    Args:
+        epoch_str (str): Epoch time as 'YYYY-MM-DD HH:MM:SS'
+    
+    Returns:
+        datetime: Parsed epoch
+    
+    Raises:
+        ValueError: If the string does not match the format
+    """
+    fields = (epoch_str[0:4], epoch_str[5:7], epoch_str[8:10],
+              epoch_str[11:13], epoch_str[14:16], epoch_str[17:19])
+    if (len(epoch_str) == 19 and epoch_str.isascii()
+            and epoch_str[4] == '-' and epoch_str[7] == '-' and epoch_str[10] == ' '
+            and epoch_str[13] == ':' and epoch_str[16] == ':'
+            and all(field.isdigit() for field in fields)):
+        return datetime(*map(int, fields))
+    return datetime.strptime(epoch_str, '%Y-%m-%d %H:%M:%S')
 
 
 def calculate_orbital_elements(tle_data):
@@ -57,16 +88,15 @@ def calculate_orbital_elements(tle_data):
         elif 'mean_motion' in tle_data:
             # Calculate from mean motion
             mean_motion = float(tle_data['mean_motion'])  # rev/day
-            mu = 398600.4418  # km^3/s^2
             mean_motion_rad_per_sec = mean_motion * 2 * np.pi / 86400
-            semi_major_axis = (mu / (mean_motion_rad_per_sec ** 2)) ** (1/3)
+            semi_major_axis = (MU_EARTH / (mean_motion_rad_per_sec ** 2)) ** (1/3)
         else:
             raise KeyError("Either 'semi_major_axis' or 'mean_motion' must be provided")
         
         # Parse epoch
         epoch_str = tle_data['epoch']
         if isinstance(epoch_str, str):
-            epoch = datetime.strptime(epoch_str, '%Y-%m-%d %H:%M:%S')
+            epoch = _parse_epoch(epoch_str)
         elif isinstance(epoch_str, datetime):
             epoch = epoch_str
         else:
@@ -93,7 +123,8 @@ def predict_future_positions(satellite, time_hours=24, resolution_minutes=10, sm
     """
     Predict satellite positions over a future time period.
     
-    Uses a while loop to generate time points and calculates positions.
+    All time points are propagated together with Satellite.calculate_positions,
+    so Kepler's equation is solved once on the whole time array.
     
     Args:
         satellite (Satellite): Satellite object to predict positions for
@@ -117,60 +148,65 @@ def predict_future_positions(satellite, time_hours=24, resolution_minutes=10, sm
     if resolution_minutes <= 0:
         raise ValueError("resolution_minutes must be positive")
     
-    # Adjust resolution for smooth plotting
-    effective_resolution = resolution_minutes / smooth_factor
-    
-    # Generate time points using a while loop
-    total_minutes = time_hours * 60
-    num_points = int(total_minutes / effective_resolution)
-    
-    time_points = []
-    positions = []
+    # Final time step, with the smoothing factor applied once; num_points
+    # already keeps every time point within the requested span
+    step_minutes = resolution_minutes / smooth_factor
+    num_points = int(time_hours * 60 / step_minutes)
+    time_points = np.arange(num_points) * (step_minutes * 60.0)
     
-    i = 0
-    while i < num_points:
-        time_delta_seconds = i * effective_resolution * 60
-        
-        if time_delta_seconds <= time_hours * 3600:  # Don't exceed requested time
-            time_points.append(time_delta_seconds)
-            pos = satellite.calculate_position(time_delta_seconds)
-            positions.append(pos)
-        
-        i += 1
+    positions = satellite.calculate_positions(time_points)
     
-    return time_points, positions
+    return time_points.tolist(), list(map(tuple, positions.tolist()))
 
 
-def generate_position_generator(satellite, time_hours=24, resolution_minutes=10):
+def generate_position_generator(satellite, time_hours=24, resolution_minutes=10, chunk_size=1024):
     """
     Generator function that yields satellite positions over time.
     
     This is a generator function that produces positions on-demand,
-    which is memory-efficient for large time ranges.
+    which is memory-efficient for large time ranges. Time points are
+    propagated in chunks with Satellite.calculate_positions, so memory stays
+    bounded by chunk_size while avoiding a scalar call per position.
     
     Args:
         satellite (Satellite): Satellite object
         time_hours (float): Number of hours into the future
         resolution_minutes (float): Time resolution in minutes
+        chunk_size (int): Number of time points propagated per batch
     
     Yields:
         tuple: (time_delta_seconds, (x, y, z)) position at that time
     
+    Raises:
+        TypeError: If satellite has no calculate_positions method
+        ValueError: If chunk_size is below 1 or resolution_minutes is not positive
+    
     Example:
         >>> for time, pos in generate_position_generator(sat, 1, 1):
         ...     print(f"Time: {time}s, Position: {pos}")
     """
-    if not isinstance(satellite, Satellite):
-        raise TypeError("satellite must be a Satellite instance")
+    # Duck-typed: anything with calculate_positions works; the method is
+    # looked up once rather than type-checked on every call
+    try:
+        calculate_positions = satellite.calculate_positions
+    except AttributeError:
+        raise TypeError("satellite must provide calculate_positions (e.g. a Satellite instance)")
+    
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if resolution_minutes <= 0:
+        raise ValueError("resolution_minutes must be positive")
     
     total_seconds = time_hours * 3600
     resolution_seconds = resolution_minutes * 60
     
-    current_time = 0
-    while current_time <= total_seconds:
-        position = satellite.calculate_position(current_time)
-        yield (current_time, position)
-        current_time += resolution_seconds
+    # Time points 0, resolution, 2*resolution, ... up to total_seconds
+    num_points = int(total_seconds // resolution_seconds) + 1
+    for start in range(0, num_points, chunk_size):
+        chunk_times = np.arange(start, min(start + chunk_size, num_points)) * resolution_seconds
+        positions = calculate_positions(chunk_times).tolist()
+        for time_delta, position in zip(chunk_times.tolist(), positions):
+            yield (time_delta, tuple(position))
 
 
 def calculate_orbital_period(satellite):
@@ -184,14 +220,16 @@ def calculate_orbital_period(satellite):
     
     Returns:
         float: Orbital period in seconds
+    
+    Raises:
+        TypeError: If satellite has no semi_major_axis
     """
-    if not isinstance(satellite, Satellite):
+    try:
+        a = satellite.semi_major_axis  # km
+    except AttributeError:
         raise TypeError("satellite must be a Satellite instance")
     
-    mu = 398600.4418  # km^3/s^2
-    a = satellite.semi_major_axis  # km
-    
-    period = 2 * np.pi * np.sqrt((a ** 3) / mu)
+    period = 2 * math.pi * math.sqrt((a ** 3) / MU_EARTH)
     return period
 
 
@@ -200,7 +238,8 @@ def calculate_velocity(satellite, time_delta_seconds=0):
     Calculate the orbital velocity of a satellite at a given time.
     
     Uses the vis-viva equation: v = sqrt(mu * (2/r - 1/a))
-    where r is the current radius and a is the semi-major axis.
+    where r = a(1 - e*cos(E)) is the current radius from the eccentric
+    anomaly and a is the semi-major axis.
     
     Args:
         satellite (Satellite): Satellite object
@@ -208,18 +247,30 @@ def calculate_velocity(satellite, time_delta_seconds=0):
     
     Returns:
         float: Velocity in km/s
+    
+    Raises:
+        TypeError: If satellite does not have the Satellite orbital elements
+        ValueError: If time_delta_seconds is negative
     """
-    if not isinstance(satellite, Satellite):
+    if time_delta_seconds < 0:
+        raise ValueError("Time delta cannot be negative")
+    
+    try:
+        a = satellite.semi_major_axis  # Semi-major axis
+        e = satellite.eccentricity
+        solve_kepler_equation = satellite.solve_kepler_equation
+    except AttributeError:
         raise TypeError("satellite must be a Satellite instance")
     
-    # Get current position
-    pos = satellite.calculate_position(time_delta_seconds)
-    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)  # Current radius
+    # Current radius straight from the eccentric anomaly: r = a(1 - e*cos(E)),
+    # no need to compute and rotate the full position vector. Everything is
+    # scalar, so math avoids the NumPy ufunc dispatch cost
+    mean_motion = math.sqrt(MU_EARTH / a ** 3)
+    M = math.radians(satellite.mean_anomaly) + mean_motion * time_delta_seconds
+    E = solve_kepler_equation(M)
+    r = a * (1 - e * math.cos(E))
     
     # Vis-viva equation for elliptical orbits: v = sqrt(mu * (2/r - 1/a))
-    mu = 398600.4418  # km^3/s^2
-    a = satellite.semi_major_axis  # Semi-major axis
-    
-    velocity = np.sqrt(mu * (2.0 / r - 1.0 / a))
+    velocity = math.sqrt(MU_EARTH * (2.0 / r - 1.0 / a))
     
     return velocity
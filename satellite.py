@@ -5,9 +5,504 @@ This module provides the Satellite class which stores orbital parameters
 and calculates satellite positions using orbital mechanics.
 """
 
+import math
 import numpy as np
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path is used without it
+    njit = None
+
+
+# Earth constants shared by the propagators and the Satellite class
+MU_EARTH = 398600.4418  # Gravitational parameter, km^3/s^2
+EARTH_RADIUS_KM = 6371.0  # Mean Earth radius, km
+TWO_PI = 2.0 * math.pi
+
+
+def _jit(func):
+    """
+    Compile a scalar helper with Numba when it is installed.
+
+    Args:
+        func (callable): Function written in Numba-compatible Python
+
+    Returns:
+        callable: The compiled function, or func unchanged without Numba
+    """
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def _shift_sincos(sin_E, cos_E, delta):
+    """
+    Return sin(E + delta) and cos(E + delta) for a small correction delta.
+
+    Uses the angle-addition formulas with short Taylor series for sin(delta)
+    and cos(delta), which are exact to machine precision for |delta| < 1e-2.
+
+    Args:
+        sin_E (float): sin(E)
+        cos_E (float): cos(E)
+        delta (float): Correction added to E
+
+    Returns:
+        tuple: (sin(E + delta), cos(E + delta))
+    """
+    d2 = delta * delta
+    sin_d = delta * (1 - d2 / 6)
+    cos_d = 1 - d2 / 2 + d2 * d2 / 24
+    return sin_E * cos_d + cos_E * sin_d, cos_E * cos_d - sin_E * sin_d
+
+
+@_jit
+def _markley(mean_anomaly_rad, eccentricity):
+    """
+    Solve Kepler's equation with Markley's (1995) non-iterative method.
+
+    A cubic approximation gives a starting value that is refined by a single
+    fifth-order correction, so no convergence loop is needed.
+
+    Args:
+        mean_anomaly_rad (float): Mean anomaly in radians, in [-π, π]
+        eccentricity (float): Eccentricity (0-1)
+
+    Returns:
+        tuple: (E, sin(E), cos(E)) with the eccentric anomaly in radians
+    """
+    M = mean_anomaly_rad
+    e = eccentricity
+    pi2 = math.pi * math.pi
+
+    # Starting value from the cubic approximation
+    alpha = (3 * pi2 + 1.6 * math.pi * (math.pi - abs(M)) / (1 + e)) / (pi2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - M * M
+    r = 3 * alpha * d * (d - 1 + e) * M + M * M * M
+    w = (abs(r) + math.sqrt(q * q * q + r * r)) ** (2 / 3)
+    E = (2 * r * w / (w * w + w * q + q * q) + M) / d
+
+    # Fifth-order correction (Halley step, then two higher-order refinements)
+    sin_E = math.sin(E)
+    cos_E = math.cos(E)
+    f0 = E - e * sin_E - M
+    f1 = 1 - e * cos_E
+    f2 = e * sin_E
+    f3 = 1 - f1
+    d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+    d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3 * d3 * f3 / 6)
+    d5 = -f0 / (f1 + 0.5 * d4 * f2 + d4 * d4 * f3 / 6 - d4 * d4 * d4 * f2 / 24)
+
+    # The correction is below 1e-3 rad, so sin/cos are updated, not recomputed
+    sin_E, cos_E = _shift_sincos(sin_E, cos_E, d5)
+    return E + d5, sin_E, cos_E
+
+
+@_jit
+def _solve_kepler_sincos(mean_anomaly_rad, eccentricity):
+    """
+    Solve Kepler's equation for a single mean anomaly, with sin(E) and cos(E).
+
+    The sine and cosine come out of the solver for free, so callers do not
+    need to evaluate them again.
+
+    Args:
+        mean_anomaly_rad (float): Mean anomaly in radians
+        eccentricity (float): Eccentricity (0-1)
+
+    Returns:
+        tuple: (E, sin(E), cos(E)) with E in radians, in [0, 2π)
+    """
+    e = eccentricity
+
+    # Normalize mean anomaly to [0, 2π]
+    M = mean_anomaly_rad % TWO_PI
+
+    # Circular orbit: E equals M
+    if e < 1e-10:
+        return M, math.sin(M), math.cos(M)
+
+    # Both solvers below work on [-π, π]; shift back afterwards
+    shift = 0.0
+    if M > math.pi:
+        M -= TWO_PI
+        shift = TWO_PI
+
+    if e < 0.3:
+        # Low eccentricity (most Earth satellites): Meeus' starting value is
+        # close enough that one Newton correction, two at e near 0.3,
+        # reaches machine precision
+        y = math.sin(M)
+        x = math.cos(M) - e
+        h = math.sqrt(x * x + y * y)
+        E = math.atan2(y, x)
+        sin_E = y / h
+        cos_E = x / h
+        for _ in range(3):
+            delta = -(E - e * sin_E - M) / (1 - e * cos_E)
+            E += delta
+            sin_E, cos_E = _shift_sincos(sin_E, cos_E, delta)
+            if abs(delta) < 1e-12:
+                break
+    else:
+        E, sin_E, cos_E = _markley(M, e)
+
+    return E + shift, sin_E, cos_E
+
+
+@_jit
+def _solve_kepler(mean_anomaly_rad, eccentricity):
+    """
+    Solve Kepler's equation for a single mean anomaly.
+
+    Args:
+        mean_anomaly_rad (float): Mean anomaly in radians
+        eccentricity (float): Eccentricity (0-1)
+
+    Returns:
+        float: Eccentric anomaly in radians, in [0, 2π)
+    """
+    E, _, _ = _solve_kepler_sincos(mean_anomaly_rad, eccentricity)
+    return E
+
+
+@_jit
+def _propagate(a, e, sqrt_1me2, M0, n, r11, r12, r21, r22, r31, r32, t):
+    """
+    Propagate one orbit to a single time after epoch.
+
+    Args:
+        a (float): Semi-major axis in km
+        e (float): Eccentricity (0-1)
+        sqrt_1me2 (float): sqrt(1 - e²)
+        M0 (float): Mean anomaly at epoch in radians
+        n (float): Mean motion in rad/s
+        r11, r12, r21, r22, r31, r32 (float): Perifocal-to-ECI rotation
+            elements from _rotation_coefficients
+        t (float): Time in seconds after epoch
+
+    Returns:
+        tuple: (x, y, z) coordinates in kilometers (ECI frame)
+    """
+    # Mean anomaly at time (initial + mean motion * t)
+    M = M0 + n * t
+
+    # Eccentric anomaly with its sine and cosine
+    _, sin_E, cos_E = _solve_kepler_sincos(M, e)
+
+    # Closed-form perifocal (PQW) coordinates straight from E; the true
+    # anomaly itself is never needed. z_pqw is zero
+    x_pqw = a * (cos_E - e)
+    y_pqw = a * sqrt_1me2 * sin_E
+
+    # Rotate to ECI with the precomputed matrix
+    x = r11 * x_pqw + r12 * y_pqw
+    y = r21 * x_pqw + r22 * y_pqw
+    z = r31 * x_pqw + r32 * y_pqw
+
+    return (x, y, z)
+
+
+if njit is not None:
+    # Compile (or load from the cache) at import so the first real call
+    # does not pay for JIT compilation
+    _propagate(7000.0, 0.001, 1.0, 0.0, 1e-3, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _kepler_positions_numba(times, a, e, sqrt_1me2, M0, n, r11, r12, r21, r22, r31, r32):
+        """
+        Compiled propagation of one orbit over an array of times.
+
+        Runs the scalar _propagate kernel for every time point, so the
+        batched and single-time paths share one solver and rotation.
+
+        Args:
+            times (numpy.ndarray): Times in seconds after epoch
+            a, e, sqrt_1me2, M0, n, r11, r12, r21, r22, r31, r32 (float):
+                Orbit constants as for _propagate
+
+        Returns:
+            numpy.ndarray: Array of shape (N, 3) with ECI positions in km
+        """
+        count = times.shape[0]
+        out = np.empty((count, 3))
+        for k in prange(count):
+            x, y, z = _propagate(a, e, sqrt_1me2, M0, n, r11, r12, r21, r22, r31, r32, times[k])
+            out[k, 0] = x
+            out[k, 1] = y
+            out[k, 2] = z
+        return out
+else:
+    _kepler_positions_numba = None
+
+
+def _solve_kepler_array(mean_anomaly_rad, eccentricity, iterations=4):
+    """
+    Solve Kepler's equation for an array of mean anomalies.
+
+    Runs a fixed number of Danby steps on the whole array at once instead
+    of checking convergence per element. Each step uses the first three
+    derivatives of f(E) = E - e*sin(E) - M for quartic convergence, at the
+    same cost of one sin and one cos as a Newton step. The eccentricity may
+    be an array that broadcasts against the mean anomalies (one value per
+    orbit).
+
+    Args:
+        mean_anomaly_rad (numpy.ndarray): Mean anomalies in radians
+        eccentricity (float or numpy.ndarray): Eccentricity (0-1)
+        iterations (int): Number of Danby iterations to apply; 3 reach
+            machine precision up to e = 0.9 and 4 up to e = 0.99
+
+    Returns:
+        numpy.ndarray: Eccentric anomalies in radians
+    """
+    e = eccentricity
+    M = np.mod(mean_anomaly_rad, 2 * np.pi)
+
+    # Danby's starting value E0 = M + 0.85*e*sign(sin(M))
+    E = M + 0.85 * np.where(M < np.pi, e, -e)
+
+    for _ in range(iterations):
+        e_sin = e * np.sin(E)
+        e_cos = e * np.cos(E)
+        f = E - e_sin - M
+        fp = 1 - e_cos
+        d1 = -f / fp
+        d2 = -f / (fp + 0.5 * d1 * e_sin)
+        E += -f / (fp + 0.5 * d2 * e_sin + d2 * d2 * e_cos / 6)
+
+    return E
+
+
+def _rotation_coefficients(inclination, raan, argument_of_perigee):
+    """
+    Compute the perifocal-to-ECI rotation R = R_z(Ω) * R_x(i) * R_z(ω).
+
+    Only the first two columns are returned because z_pqw is always zero.
+    Angles may be scalars or arrays.
+
+    Args:
+        inclination (array-like): Inclination in degrees
+        raan (array-like): RAAN in degrees
+        argument_of_perigee (array-like): Argument of perigee in degrees
+
+    Returns:
+        tuple: (r11, r12, r21, r22, r31, r32) rotation matrix elements
+    """
+    omega = np.radians(argument_of_perigee)
+    i = np.radians(inclination)
+    Omega = np.radians(raan)
+    co, so = np.cos(omega), np.sin(omega)
+    ci, si = np.cos(i), np.sin(i)
+    cO, sO = np.cos(Omega), np.sin(Omega)
+    return (
+        cO * co - sO * ci * so,
+        -cO * so - sO * ci * co,
+        sO * co + cO * ci * so,
+        -sO * so + cO * ci * co,
+        si * so,
+        si * co,
+    )
+
+
+def _rotate_to_eci(x_pqw, y_pqw, coefficients, dtype=np.float64):
+    """
+    Rotate perifocal coordinates to ECI into one preallocated array.
+
+    Each component is written straight into its column of the output, so no
+    separate x, y, z arrays are built and then copied by np.stack.
+
+    Args:
+        x_pqw (numpy.ndarray): Perifocal x coordinates in km
+        y_pqw (numpy.ndarray): Perifocal y coordinates in km
+        coefficients (tuple): (r11, r12, r21, r22, r31, r32) from _rotation_coefficients
+        dtype (numpy.dtype): Floating-point type of the result
+
+    Returns:
+        numpy.ndarray: ECI positions with the broadcast shape of the inputs
+                       plus a trailing axis of length 3
+    """
+    r11, r12, r21, r22, r31, r32 = coefficients
+    shape = np.broadcast_shapes(np.shape(x_pqw), np.shape(r11))
+    out = np.empty(shape + (3,), dtype=dtype)
+    for col, (rx, ry) in enumerate(((r11, r12), (r21, r22), (r31, r32))):
+        column = out[..., col]
+        np.multiply(rx, x_pqw, out=column)
+        column += ry * y_pqw
+    return out
+
+
+def propagate_batch(semi_major_axis, eccentricity, inclination, raan,
+                    argument_of_perigee, mean_anomaly, time_deltas_seconds,
+                    dtype=np.float64):
+    """
+    Propagate one or many orbits over an array of times in one NumPy pass.
+
+    All arguments are broadcast against each other, so stacking the elements
+    of S satellites as (S, 1) columns and passing times of shape (N,) solves
+    Kepler's equation once on the whole (S, N) grid.
+
+    Args:
+        semi_major_axis (array-like): Semi-major axis in km
+        eccentricity (array-like): Eccentricity (0-1)
+        inclination (array-like): Inclination in degrees
+        raan (array-like): Right Ascension of Ascending Node in degrees
+        argument_of_perigee (array-like): Argument of perigee in degrees
+        mean_anomaly (array-like): Mean anomaly at epoch in degrees
+        time_deltas_seconds (array-like): Times in seconds after epoch
+        dtype (numpy.dtype): Floating point type of the Kepler solve, the
+            rotation and the result. np.float32 halves memory traffic and is
+            accurate to tens of metres, which is plenty for plotting
+            (default: np.float64)
+
+    Returns:
+        numpy.ndarray: ECI positions in km with the broadcast shape of the
+                       inputs plus a trailing axis of length 3, e.g. (S, N, 3)
+
+    Raises:
+        ValueError: If any time delta is negative
+    """
+    t = np.asarray(time_deltas_seconds, dtype=np.float64)
+    if np.any(t < 0):
+        raise ValueError("Time delta cannot be negative")
+
+    a = np.asarray(semi_major_axis, dtype=np.float64)
+    e = np.asarray(eccentricity, dtype=np.float64)
+    mean_motion = np.sqrt(MU_EARTH / (a ** 3))
+
+    # Mean anomaly at every time point, reduced to one orbit in float64 so
+    # that a lower-precision dtype does not lose accuracy over long spans
+    M = np.mod(np.radians(mean_anomaly) + mean_motion * t, TWO_PI).astype(dtype, copy=False)
+    a = a.astype(dtype, copy=False)
+    e = e.astype(dtype, copy=False)
+
+    # Eccentric anomaly
+    E = _solve_kepler_array(M, e)
+
+    # Closed-form perifocal coordinates from E (z_pqw is zero)
+    x_pqw = a * (np.cos(E) - e)
+    y_pqw = a * np.sqrt(1 - e * e) * np.sin(E)
+
+    # Rotation to ECI, computed once per orbit rather than once per time point
+    coefficients = tuple(
+        np.asarray(coef, dtype=dtype)
+        for coef in _rotation_coefficients(inclination, raan, argument_of_perigee)
+    )
+
+    return _rotate_to_eci(x_pqw, y_pqw, coefficients, dtype=dtype)
+
+
+# Types that float() converts but that are not numbers for an orbital element
+_NON_NUMERIC_TYPES = (str, bytes, bytearray, bool, np.bool_)
+
+
+def _as_float(value):
+    """Return value as a finite float, or None if it is not a finite number."""
+    if isinstance(value, _NON_NUMERIC_TYPES):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+# Range check and error message for each numeric orbital element, shared by
+# the constructor's error report and the element setters
+_ELEMENT_CHECKS = {
+    'inclination': (lambda v: 0 <= v <= 180,
+                    "Inclination must be a number between 0 and 180 degrees"),
+    'eccentricity': (lambda v: 0 <= v < 1,
+                     "Eccentricity must be a number between 0 and 1"),
+    'semi_major_axis': (lambda v: v > 0,
+                        "Semi-major axis must be a positive number"),
+    'mean_anomaly': (lambda v: True,  # any finite angle
+                     "Mean anomaly must be a number"),
+    'raan': (lambda v: 0 <= v < 360,
+             "RAAN must be a number between 0 and 360 degrees"),
+    'argument_of_perigee': (lambda v: 0 <= v < 360,
+                            "Argument of perigee must be a number between 0 and 360 degrees"),
+}
+
+
+def _checked_element(element, value):
+    """
+    Convert an orbital element to float and check its range.
+    
+    Args:
+        element (str): Name of the element, a key of _ELEMENT_CHECKS
+        value: Value to check
+    
+    Returns:
+        float: The value as a Python float
+    
+    Raises:
+        ValueError: If the value is not a number or is out of range
+    """
+    check, message = _ELEMENT_CHECKS[element]
+    number = _as_float(value)
+    if number is None or not check(number):
+        raise ValueError(message)
+    return number
+
+
+def _invalid_satellite_error(name, satellite_id, inclination, eccentricity,
+                             semi_major_axis, mean_anomaly, epoch, raan, argument_of_perigee):
+    """
+    Build the error for Satellite arguments that failed the combined check.
+    
+    Checks each field in turn so the message names the first invalid one.
+    
+    Returns:
+        ValueError: Error describing the invalid argument
+    """
+    if not isinstance(name, str) or not name:
+        return ValueError("Satellite name must be a non-empty string")
+    if not isinstance(satellite_id, str) or not satellite_id:
+        return ValueError("Satellite ID must be a non-empty string")
+    
+    try:
+        _checked_element('inclination', inclination)
+        _checked_element('eccentricity', eccentricity)
+        _checked_element('semi_major_axis', semi_major_axis)
+        _checked_element('mean_anomaly', mean_anomaly)
+        if not isinstance(epoch, datetime):
+            return ValueError("Epoch must be a datetime object")
+        _checked_element('raan', raan)
+        _checked_element('argument_of_perigee', argument_of_perigee)
+    except ValueError as error:
+        return error
+    return ValueError("Invalid satellite parameters")
+
+
+def _element_property(element, doc):
+    """
+    Build a property for an orbital element stored in the slot '_' + element.
+    
+    The setter validates the new value and refreshes the cached per-orbit
+    constants, so positions and altitudes always follow the current elements.
+    
+    Args:
+        element (str): Name of the element, a key of _ELEMENT_CHECKS
+        doc (str): Docstring of the property
+    
+    Returns:
+        property: The element property
+    """
+    slot = '_' + element
+    
+    def fget(self):
+        return getattr(self, slot)
+    
+    def fset(self, value):
+        setattr(self, slot, _checked_element(element, value))
+        self._update_orbit_constants()
+    
+    return property(fget, fset, doc=doc)
+
 
 class Satellite:
     """
@@ -27,8 +522,29 @@ class Satellite:
         raan (float): Right Ascension of Ascending Node in degrees (Ω)
         argument_of_perigee (float): Argument of perigee in degrees (ω)
         epoch (datetime): Epoch time of the orbital parameters
+    
+    The orbital elements are validated on assignment, and reassigning one
+    refreshes the cached constants used by the position calculations.
     """
     
+    # Fixed attribute layout: no per-instance __dict__ for large catalogs
+    __slots__ = (
+        'name', 'satellite_id', 'epoch',
+        '_inclination', '_eccentricity', '_semi_major_axis',
+        '_mean_anomaly', '_raan', '_argument_of_perigee',
+        '_altitude', '_perigee_alt', '_apogee_alt',
+        '_mean_motion', '_M0_rad', '_sqrt_1me2',
+        '_r11', '_r12', '_r21', '_r22', '_r31', '_r32',
+        '_sinE_grid', '_cosE_grid',
+    )
+    
+    inclination = _element_property('inclination', "Orbital inclination in degrees")
+    eccentricity = _element_property('eccentricity', "Orbital eccentricity (0-1)")
+    semi_major_axis = _element_property('semi_major_axis', "Semi-major axis in kilometers")
+    mean_anomaly = _element_property('mean_anomaly', "Mean anomaly in degrees (at epoch)")
+    raan = _element_property('raan', "Right Ascension of Ascending Node in degrees")
+    argument_of_perigee = _element_property('argument_of_perigee', "Argument of perigee in degrees")
+    
     def __init__(self, name, satellite_id, inclination, eccentricity, 
                  semi_major_axis, mean_anomaly, epoch, raan=0.0, argument_of_perigee=0.0):
         """
@@ -45,84 +561,98 @@ class Satellite:
             raan (float): Right Ascension of Ascending Node in degrees (default: 0.0)
             argument_of_perigee (float): Argument of perigee in degrees (default: 0.0)
         
+        The orbital elements may be any finite real number, including NumPy
+        scalars; they are stored as Python floats. Strings, bytes and
+        booleans are rejected even though float() would accept them.
+        
         Raises:
             ValueError: If input parameters are invalid
         """
-        # Validate inputs with exception handling
-        if not isinstance(name, str) or not name:
-            raise ValueError("Satellite name must be a non-empty string")
-        if not isinstance(satellite_id, str) or not satellite_id:
-            raise ValueError("Satellite ID must be a non-empty string")
-        
-        if not isinstance(inclination, (int, float)) or inclination < 0 or inclination > 180:
-            raise ValueError("Inclination must be a number between 0 and 180 degrees")
-        if not isinstance(eccentricity, (int, float)) or eccentricity < 0 or eccentricity >= 1:
-            raise ValueError("Eccentricity must be a number between 0 and 1")
-        if not isinstance(semi_major_axis, (int, float)) or semi_major_axis <= 0:
-            raise ValueError("Semi-major axis must be a positive number")
-        if not isinstance(mean_anomaly, (int, float)):
-            raise ValueError("Mean anomaly must be a number")
-        
-        if not isinstance(epoch, datetime):
-            raise ValueError("Epoch must be a datetime object")
-        if not isinstance(raan, (int, float)) or raan < 0 or raan >= 360:
-            raise ValueError("RAAN must be a number between 0 and 360 degrees")
-        if not isinstance(argument_of_perigee, (int, float)) or argument_of_perigee < 0 or argument_of_perigee >= 360:
-            raise ValueError("Argument of perigee must be a number between 0 and 360 degrees")
+        # Coerce the numeric elements in one pass and check every range in a
+        # single short-circuited expression; the per-field checks below only
+        # run on failure, to report which value is invalid
+        elements = (inclination, eccentricity, semi_major_axis,
+                    mean_anomaly, raan, argument_of_perigee)
+        try:
+            incl, ecc, sma, m0, rn, ap = map(float, elements)
+            valid = (isinstance(name, str) and name != '' and isinstance(satellite_id, str)
+                     and satellite_id != '' and isinstance(epoch, datetime)
+                     and 0 <= incl <= 180 and 0 <= ecc < 1 and sma > 0
+                     and 0 <= rn < 360 and 0 <= ap < 360
+                     # The bounded ranges above already exclude NaN and infinity
+                     and math.isfinite(sma) and math.isfinite(m0)
+                     and not any(isinstance(value, _NON_NUMERIC_TYPES) for value in elements))
+        except (TypeError, ValueError):
+            valid = False
+        if not valid:
+            raise _invalid_satellite_error(name, satellite_id, inclination, eccentricity,
+                                           semi_major_axis, mean_anomaly, epoch, raan,
+                                           argument_of_perigee)
         
         # Assign attributes
         self.name = name
         self.satellite_id = satellite_id
-        self.inclination = float(inclination)
-        self.eccentricity = float(eccentricity)
-        self.semi_major_axis = float(semi_major_axis)
-        self.mean_anomaly = float(mean_anomaly)
-        self.raan = float(raan)
-        self.argument_of_perigee = float(argument_of_perigee)
+        self._inclination = incl
+        self._eccentricity = ecc
+        self._semi_major_axis = sma
+        self._mean_anomaly = m0
+        self._raan = rn
+        self._argument_of_perigee = ap
         self.epoch = epoch
+        
+        self._update_orbit_constants()
+    
+    def _update_orbit_constants(self):
+        """
+        Recompute the values derived from the orbital elements.
+        
+        Called by the constructor and whenever an element is reassigned, so
+        the cached constants never go stale; the Kepler lookup table is
+        dropped and rebuilt on next use.
+        """
+        a = self._semi_major_axis
+        e = self._eccentricity
+        
+        # Derived altitudes, cached so the comparison operators are a single
+        # attribute load
+        self._altitude = a - EARTH_RADIUS_KM
+        self._perigee_alt = a * (1 - e) - EARTH_RADIUS_KM
+        self._apogee_alt = a * (1 + e) - EARTH_RADIUS_KM
+        
+        # Per-orbit constants used by every position calculation
+        self._mean_motion = math.sqrt(MU_EARTH / a ** 3)
+        self._M0_rad = math.radians(self._mean_anomaly)
+        self._sqrt_1me2 = math.sqrt(1 - e ** 2)
+        
+        # Perifocal-to-ECI rotation, computed here instead of on every
+        # position calculation
+        (self._r11, self._r12, self._r21,
+         self._r22, self._r31, self._r32) = map(float, _rotation_coefficients(
+            self._inclination, self._raan, self._argument_of_perigee))
+        
+        # Kepler lookup table, built on first use by _kepler_table
+        self._sinE_grid = None
+        self._cosE_grid = None
     
     def solve_kepler_equation(self, mean_anomaly_rad, tolerance=1e-10, max_iterations=100):
         """
         Solve Kepler's equation: M = E - e*sin(E) for eccentric anomaly E.
         
-        Uses Newton's method for iterative solution.
+        Low-eccentricity orbits (e < 0.3) use Meeus' starting value with one
+        or two Newton corrections; higher eccentricities use Markley's
+        non-iterative solver. Both reach machine precision.
         
         Args:
             mean_anomaly_rad (float): Mean anomaly in radians
-            tolerance (float): Convergence tolerance
-            max_iterations (int): Maximum number of iterations
+            tolerance (float): Kept for backward compatibility; ignored, since
+                the solver always reaches machine precision
+            max_iterations (int): Kept for backward compatibility; ignored,
+                since the solver uses a fixed, small number of steps
         
         Returns:
-            float: Eccentric anomaly in radians
-        """
-        # Initial guess: for small eccentricity, E ≈ M
-        # For larger e, use better initial guess
-        if self.eccentricity < 0.8:
-            E = mean_anomaly_rad
-        else:
-            E = np.pi  # Better initial guess for high eccentricity
-        
-        # Normalize mean anomaly to [0, 2π]
-        mean_anomaly_rad = mean_anomaly_rad % (2 * np.pi)
-        
-        # Newton's method iteration
-        for _ in range(max_iterations):
-            # Calculate f(E) = E - e*sin(E) - M
-            f = E - self.eccentricity * np.sin(E) - mean_anomaly_rad
-            
-            # Calculate f'(E) = 1 - e*cos(E)
-            f_prime = 1 - self.eccentricity * np.cos(E)
-            
-            # Update: E_new = E_old - f(E)/f'(E)
-            E_new = E - f / f_prime
-            
-            # Check convergence
-            if abs(E_new - E) < tolerance:
-                return E_new
-            
-            E = E_new
-        
-        return E  # Return last computed value if convergence not reached
+            float: Eccentric anomaly in radians, in [0, 2π)
+        """
+        return _solve_kepler(float(mean_anomaly_rad), self.eccentricity)
     
     def calculate_position(self, time_delta_seconds):
         """
@@ -143,71 +673,122 @@ class Satellite:
         if time_delta_seconds < 0:
             raise ValueError("Time delta cannot be negative")
         
-        # Earth gravitational parameter (km^3/s^2)
-        mu = 398600.4418
-        
-        # Mean motion (rad/s) - angular velocity
-        mean_motion = np.sqrt(mu / (self.semi_major_axis ** 3))
+        return _propagate(self.semi_major_axis, self.eccentricity, self._sqrt_1me2,
+                          self._M0_rad, self._mean_motion, self._r11, self._r12,
+                          self._r21, self._r22, self._r31, self._r32,
+                          float(time_delta_seconds))
+
+    def _kepler_table(self, n=None):
+        """
+        Return tabulated sin(E) and cos(E) over one orbit of mean anomaly.
+
+        The eccentricity is fixed for a satellite, so E(M) is solved once on
+        n + 1 evenly spaced mean anomalies in [0, 2π] and kept for later calls.
+        E changes fastest with M near perigee, and the interpolation error
+        grows like 1/(1 - e)², so eccentric orbits get a finer table.
+
+        Args:
+            n (int): Number of table intervals; by default 4096 up to e = 0.7,
+                growing as 1/(1 - e) beyond that and capped at 2**17
+
+        Returns:
+            tuple: (sin_E_grid, cos_E_grid) arrays of length n + 1
+        """
+        if n is None:
+            n = min(int(4096 * max(1.0, 0.3 / (1.0 - self.eccentricity))), 2 ** 17)
+        if self._sinE_grid is None or len(self._sinE_grid) != n + 1:
+            grid = _solve_kepler_array(np.linspace(0, TWO_PI, n + 1), self.eccentricity)
+            self._sinE_grid = np.sin(grid)
+            self._cosE_grid = np.cos(grid)
+        return self._sinE_grid, self._cosE_grid
+
+    def calculate_positions(self, time_deltas_seconds, use_table=False, dtype=np.float64):
+        """
+        Calculate satellite positions at many times after epoch in one call.
+
+        Vectorized counterpart of calculate_position: all time points are
+        propagated together with NumPy array operations.
+
+        Args:
+            time_deltas_seconds (array-like): Times in seconds after epoch
+            use_table (bool): Interpolate sin(E) and cos(E) from the table
+                built by _kepler_table instead of solving Kepler's equation.
+                Faster for long time arrays, at plotting accuracy: the error
+                stays below about 4e-6 of the semi-major axis (e.g. 0.03 km
+                in LEO, 0.15 km at GEO distance) up to e = 0.99 and grows
+                beyond that (default: False)
+            dtype (numpy.dtype): Floating point type of the result; see
+                propagate_batch (default: np.float64)
+
+        Returns:
+            numpy.ndarray: Array of shape (N, 3) with (x, y, z) coordinates
+                           in kilometers (ECI frame)
+
+        Raises:
+            ValueError: If any time delta is negative
+        """
+        t = np.asarray(time_deltas_seconds, dtype=np.float64)
+        if np.any(t < 0):
+            raise ValueError("Time delta cannot be negative")
+
+        a = self.semi_major_axis
+        e = self.eccentricity
+        mean_motion = self._mean_motion
+
+        if use_table:
+            sin_grid, cos_grid = self._kepler_table()
+            n = len(sin_grid) - 1
+
+            # Linear interpolation between neighbouring table entries
+            M = np.mod(self._M0_rad + mean_motion * t, TWO_PI)
+            idx = M * (n / TWO_PI)
+            i0 = np.minimum(idx.astype(np.int32), n - 1)
+            frac = idx - i0
+            sin_E = (1 - frac) * sin_grid[i0] + frac * sin_grid[i0 + 1]
+            cos_E = (1 - frac) * cos_grid[i0] + frac * cos_grid[i0 + 1]
+
+            # Perifocal coordinates straight from E, then the cached rotation
+            x_pqw = a * (cos_E - e)
+            y_pqw = a * self._sqrt_1me2 * sin_E
+            coefficients = (self._r11, self._r12, self._r21,
+                            self._r22, self._r31, self._r32)
+            return _rotate_to_eci(x_pqw, y_pqw, coefficients, dtype=dtype)
+
+        # Use the compiled (float64) kernel when Numba is installed
+        if _kepler_positions_numba is not None and np.dtype(dtype) == np.float64:
+            return _kepler_positions_numba(
+                t.ravel(), a, e, self._sqrt_1me2, self._M0_rad, mean_motion,
+                self._r11, self._r12, self._r21, self._r22, self._r31, self._r32
+            ).reshape(t.shape + (3,))
+
+        # NumPy fallback: the batch propagator with scalar elements
+        return propagate_batch(
+            self.semi_major_axis, self.eccentricity, self.inclination,
+            self.raan, self.argument_of_perigee, self.mean_anomaly, t,
+            dtype=dtype
+        )
+
+    @staticmethod
+    def propagate_many(satellites, time_deltas_seconds, dtype=np.float64):
+        """
+        Calculate positions of several satellites at the same time points.
         
-        # Mean anomaly at time (initial + change over time)
-        mean_anomaly_rad = np.radians(self.mean_anomaly)
-        mean_anomaly_at_time = mean_anomaly_rad + mean_motion * time_delta_seconds
+        The elements are packed into a SatelliteArray so that every
+        (satellite, time) pair is propagated in one vectorized call.
         
-        # Solve Kepler's equation to get eccentric anomaly
-        E = self.solve_kepler_equation(mean_anomaly_at_time)
+        Args:
+            satellites (list): List of Satellite objects
+            time_deltas_seconds (array-like): Times in seconds after epoch, shape (N,)
+            dtype (numpy.dtype): Floating point type of the result (default: np.float64)
         
-        # Calculate true anomaly from eccentric anomaly
-        # tan(ν/2) = sqrt((1+e)/(1-e)) * tan(E/2)
-        if self.eccentricity < 1e-10:  # Circular orbit
-            nu = E  # True anomaly equals eccentric anomaly for circular orbits
-        else:
-            sqrt_term = np.sqrt((1 + self.eccentricity) / (1 - self.eccentricity))
-            nu = 2 * np.arctan2(sqrt_term * np.sin(E/2), np.cos(E/2))
+        Returns:
+            numpy.ndarray: Array of shape (S, N, 3) with ECI positions in km
         
-        # Calculate radius from true anomaly
-        # r = a(1 - e²) / (1 + e*cos(ν))
-        a = self.semi_major_axis
-        e = self.eccentricity
-        r = a * (1 - e**2) / (1 + e * np.cos(nu))
-        
-        # Convert to Cartesian coordinates in perifocal frame (PQW frame)
-        # where P points to perigee, Q is 90° ahead in orbital plane
-        x_pqw = r * np.cos(nu)
-        y_pqw = r * np.sin(nu)
-        z_pqw = 0.0
-        
-        # Transform from perifocal frame to ECI frame using rotation matrices
-        # Rotation sequence: R_z(ω) * R_x(i) * R_z(Ω)
-        omega = np.radians(self.argument_of_perigee)  # Argument of perigee
-        i = np.radians(self.inclination)  # Inclination
-        Omega = np.radians(self.raan)  # RAAN
-        
-        # Calculate rotation matrix components
-        cos_omega = np.cos(omega)
-        sin_omega = np.sin(omega)
-        cos_i = np.cos(i)
-        sin_i = np.sin(i)
-        cos_Omega = np.cos(Omega)
-        sin_Omega = np.sin(Omega)
-        
-        # Apply rotation matrix: R = R_z(Ω) * R_x(i) * R_z(ω)
-        # First rotation: R_z(ω) - argument of perigee
-        x1 = x_pqw * cos_omega - y_pqw * sin_omega
-        y1 = x_pqw * sin_omega + y_pqw * cos_omega
-        z1 = z_pqw
-        
-        # Second rotation: R_x(i) - inclination
-        x2 = x1
-        y2 = y1 * cos_i - z1 * sin_i
-        z2 = y1 * sin_i + z1 * cos_i
-        
-        # Third rotation: R_z(Ω) - RAAN
-        x = x2 * cos_Omega - y2 * sin_Omega
-        y = x2 * sin_Omega + y2 * cos_Omega
-        z = z2
-        
-        return (x, y, z)
-    
+        Raises:
+            ValueError: If satellites is empty or any time delta is negative
+        """
+        return SatelliteArray(satellites).propagate(time_deltas_seconds, dtype=dtype)
+
     def get_altitude(self):
         """
         Calculate the mean altitude of the satellite above Earth's surface.
@@ -218,8 +799,7 @@ class Satellite:
         Returns:
             float: Mean altitude in kilometers
         """
-        earth_radius = 6371.0  # km
-        return self.semi_major_axis - earth_radius
+        return self._altitude
     
     def get_perigee_altitude(self):
         """
@@ -228,9 +808,7 @@ class Satellite:
         Returns:
             float: Perigee altitude in kilometers
         """
-        earth_radius = 6371.0  # km
-        perigee_radius = self.semi_major_axis * (1 - self.eccentricity)
-        return perigee_radius - earth_radius
+        return self._perigee_alt
     
     def get_apogee_altitude(self):
         """
@@ -239,9 +817,7 @@ class Satellite:
         Returns:
             float: Apogee altitude in kilometers
         """
-        earth_radius = 6371.0  # km
-        apogee_radius = self.semi_major_axis * (1 + self.eccentricity)
-        return apogee_radius - earth_radius
+        return self._apogee_alt
     
     def __str__(self):
         """
@@ -250,7 +826,7 @@ class Satellite:
         Returns:
             str: Formatted string with satellite information
         """
-        altitude = self.get_altitude()
+        altitude = self._altitude
         return (f"Satellite(name='{self.name}', id='{self.satellite_id}', "
                 f"inclination={self.inclination:.2f}°, "
                 f"eccentricity={self.eccentricity:.6f}, "
@@ -293,23 +869,88 @@ class Satellite:
         """
         if not isinstance(other, Satellite):
             raise TypeError(f"Cannot compare Satellite with {type(other)}")
-        return self.get_altitude() < other.get_altitude()
+        return self._altitude < other._altitude
     
     def __le__(self, other):
         """Operator overloading: less than or equal comparison."""
         if not isinstance(other, Satellite):
             raise TypeError(f"Cannot compare Satellite with {type(other)}")
-        return self.get_altitude() <= other.get_altitude()
+        return self._altitude <= other._altitude
     
     def __gt__(self, other):
         """Operator overloading: greater than comparison."""
         if not isinstance(other, Satellite):
             raise TypeError(f"Cannot compare Satellite with {type(other)}")
-        return self.get_altitude() > other.get_altitude()
+        return self._altitude > other._altitude
     
     def __ge__(self, other):
         """Operator overloading: greater than or equal comparison."""
         if not isinstance(other, Satellite):
             raise TypeError(f"Cannot compare Satellite with {type(other)}")
-        return self.get_altitude() >= other.get_altitude()
+        return self._altitude >= other._altitude
+
 
+class SatelliteArray:
+    """
+    A constellation of satellites stored as parallel arrays of elements.
+    
+    Each orbital element is kept as one NumPy array of shape (N,) instead
+    of N Satellite objects, so a whole constellation is propagated with a
+    single vectorized Kepler solve and rotation.
+    
+    Attributes:
+        names (list): Satellite names, in input order
+        a (numpy.ndarray): Semi-major axes in km
+        e (numpy.ndarray): Eccentricities
+        inclination (numpy.ndarray): Inclinations in degrees
+        raan (numpy.ndarray): RAANs in degrees
+        argument_of_perigee (numpy.ndarray): Arguments of perigee in degrees
+        mean_anomaly (numpy.ndarray): Mean anomalies at epoch in degrees
+    """
+    
+    def __init__(self, satellites):
+        """
+        Pack the orbital elements of a list of satellites.
+        
+        Args:
+            satellites (list): List of Satellite objects
+        
+        Raises:
+            ValueError: If satellites is empty
+        """
+        if not satellites:
+            raise ValueError("At least one satellite must be provided")
+        
+        self.names = [sat.name for sat in satellites]
+        (self.a, self.e, self.inclination, self.raan,
+         self.argument_of_perigee, self.mean_anomaly) = np.array([
+            (sat.semi_major_axis, sat.eccentricity, sat.inclination,
+             sat.raan, sat.argument_of_perigee, sat.mean_anomaly)
+            for sat in satellites
+        ]).T.copy()
+    
+    def __len__(self):
+        """Return the number of satellites in the array."""
+        return len(self.names)
+    
+    def propagate(self, time_deltas_seconds, dtype=np.float64):
+        """
+        Calculate positions of every satellite at every time point.
+        
+        Args:
+            time_deltas_seconds (array-like): Times in seconds after epoch, shape (M,)
+            dtype (numpy.dtype): Floating point type of the result; see
+                propagate_batch (default: np.float64)
+        
+        Returns:
+            numpy.ndarray: Array of shape (N, M, 3) with ECI positions in km
+        
+        Raises:
+            ValueError: If any time delta is negative
+        """
+        t = np.asarray(time_deltas_seconds, dtype=np.float64)
+        return propagate_batch(
+            self.a[:, None], self.e[:, None], self.inclination[:, None],
+            self.raan[:, None], self.argument_of_perigee[:, None],
+            self.mean_anomaly[:, None], t, dtype=dtype
+        )
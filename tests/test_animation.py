@@ -0,0 +1,115 @@
+"""
+Test module for the orbit animations.
+
+This module contains pytest tests for the frames rendered by
+create_orbit_animation and create_multi_satellite_animation.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+import sys
+import os
+
+import matplotlib
+matplotlib.use('Agg')  # No display needed for tests
+import matplotlib.pyplot as plt
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from satellite import Satellite
+from animation import (
+    create_orbit_animation,
+    create_multi_satellite_animation,
+    MAX_RENDER_FPS,
+    MAX_TRAIL_POINTS
+)
+
+
+# Expected rendered frames per simulation length. A 0.01 h simulation has
+# 60 data points but is capped at MAX_RENDER_FPS to 40 rendered frames; the
+# longer ones render every data point
+ORBIT_FRAMES = {0.01: 40, 0.05: 60, 2: 103, 6: 311}
+MULTI_FRAMES = {0.01: 40, 0.05: 60, 2: 60, 6: 71}
+
+
+class TestAnimation:
+    """Test class for the animation builders."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def satellites(cls):
+        """Create a low and a high satellite shared by the tests of the class."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        return [
+            Satellite("LowSat", "11111", 51.6, 0.001, 6778.0, 0.0, epoch),
+            Satellite("HighSat", "22222", 55.0, 0.01, 26560.0, 90.0, epoch, raan=45.0)
+        ]
+
+    @staticmethod
+    def render_all_frames(anim):
+        """
+        Call the animation callback for every rendered frame.
+
+        An out-of-range frame index would raise IndexError here.
+
+        Returns:
+            tuple: (list of rendered frames, artists returned for the last one)
+        """
+        frames = list(anim.new_frame_seq())
+        for frame in frames:
+            artists = anim._func(frame)
+        return frames, artists
+
+    def test_orbit_animation_frames(self, satellites):
+        """Test the frame count, the render rate and that the last frame is shown."""
+        sat = satellites[0]
+        for hours, expected_frames in ORBIT_FRAMES.items():
+            anim, fig = create_orbit_animation(sat, simulation_hours=hours)
+            frames, (marker, _, _, _) = self.render_all_frames(anim)
+
+            assert len(frames) == expected_frames
+            assert 1000 / anim.event_source.interval <= MAX_RENDER_FPS + 1e-9
+            # The last rendered frame is the end of the simulation
+            final = np.ravel(marker.get_data_3d())
+            assert final == pytest.approx(sat.calculate_position(hours * 3600), abs=1e-6)
+            plt.close(fig)
+
+    def test_multi_satellite_animation_frames(self, satellites):
+        """Test every satellite reaches its final position on the last rendered frame."""
+        for hours, expected_frames in MULTI_FRAMES.items():
+            anim, fig = create_multi_satellite_animation(satellites, simulation_hours=hours)
+            frames, artists = self.render_all_frames(anim)
+
+            assert len(frames) == expected_frames
+            assert 1000 / anim.event_source.interval <= MAX_RENDER_FPS + 1e-9
+            markers = artists[:len(satellites)]
+            for sat, marker in zip(satellites, markers):
+                final = np.ravel(marker.get_data_3d())
+                assert final == pytest.approx(sat.calculate_position(hours * 3600), abs=1e-6)
+            plt.close(fig)
+
+    def test_trail_is_strided_and_ends_at_current_position(self, satellites):
+        """Test trails stay within MAX_TRAIL_POINTS and end at the marker."""
+        count = len(satellites)
+        builders = [
+            # Single satellite: the callback returns (marker, trail, time, info)
+            (lambda trail_length: create_orbit_animation(
+                satellites[0], simulation_hours=6, trail_length=trail_length),
+             lambda artists: [artists[:2]]),
+            # Multiple satellites: all markers, then all trails, then the time
+            (lambda trail_length: create_multi_satellite_animation(
+                satellites, simulation_hours=6, trail_length=trail_length),
+             lambda artists: zip(artists[:count], artists[count:2 * count])),
+        ]
+        for build, marker_trail_pairs in builders:
+            for trail_length in [10, 50, 64, 200]:
+                anim, fig = build(trail_length)
+                for frame in anim.new_frame_seq():
+                    for marker, trail in marker_trail_pairs(anim._func(frame)):
+                        trail_data = np.array(trail.get_data_3d())
+                        assert 1 <= trail_data.shape[1] <= MAX_TRAIL_POINTS
+                        assert trail_data[:, -1] == pytest.approx(
+                            np.ravel(marker.get_data_3d()))
+                plt.close(fig)
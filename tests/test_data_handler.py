@@ -0,0 +1,113 @@
+"""
+Test module for data handling functions.
+
+This module contains pytest tests for reading satellite data from CSV
+files in data_handler.py.
+"""
+
+import pytest
+from datetime import datetime
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_handler import read_satellite_data_from_file, write_satellite_summary_to_file
+from satellite import Satellite
+
+
+HEADER = "name,id,inclination,eccentricity,semi_major_axis,mean_anomaly,raan,argument_of_perigee,epoch\n"
+VALID_ROW = "ISS,25544,51.6444,0.0001647,6778.14,45.2,238.5,112.0,2024-01-01 00:00:00\n"
+
+
+class TestReadSatelliteData:
+    """Test class for read_satellite_data_from_file."""
+
+    @pytest.fixture
+    def write_csv(self, tmp_path):
+        """Return a function that writes CSV text to a temporary file."""
+        def write(text):
+            path = tmp_path / "satellites.csv"
+            path.write_text(text, encoding='utf-8')
+            return str(path)
+        return write
+
+    def test_read_valid_file(self, write_csv):
+        """Test a valid row is parsed into Python values."""
+        satellites = read_satellite_data_from_file(write_csv(HEADER + VALID_ROW))
+
+        assert satellites == [{
+            'name': 'ISS',
+            'id': '25544',
+            'inclination': 51.6444,
+            'eccentricity': 0.0001647,
+            'semi_major_axis': 6778.14,
+            'mean_anomaly': 45.2,
+            'raan': 238.5,
+            'argument_of_perigee': 112.0,
+            'epoch': datetime(2024, 1, 1, 0, 0, 0)
+        }]
+        assert type(satellites[0]['inclination']) is float
+
+    def test_bad_cells_are_skipped(self, write_csv, capsys):
+        """Test rows with a non-numeric value or a bad epoch are skipped with a warning."""
+        text = (HEADER + VALID_ROW
+                + "Bad,1,abc,0.1,7000,0,0,0,2024-01-01 00:00:00\n"
+                + "BadEpoch,2,10,0.1,7000,0,0,0,not a date\n")
+        satellites = read_satellite_data_from_file(write_csv(text))
+
+        assert [sat['name'] for sat in satellites] == ['ISS']
+        output = capsys.readouterr().out
+        assert "row 3: invalid value in inclination" in output
+        assert "row 4: invalid value in epoch" in output
+
+    def test_short_row_is_skipped(self, write_csv, capsys):
+        """Test a row with missing trailing fields is skipped with a warning."""
+        text = HEADER + VALID_ROW + "Short,3,10,0.1\n"
+        satellites = read_satellite_data_from_file(write_csv(text))
+
+        assert [sat['name'] for sat in satellites] == ['ISS']
+        assert "row 3" in capsys.readouterr().out
+
+    def test_missing_optional_columns_default_to_zero(self, write_csv):
+        """Test raan and argument_of_perigee default to 0.0 when the columns are absent."""
+        text = ("name,id,inclination,eccentricity,semi_major_axis,mean_anomaly,epoch\n"
+                "A,1,10,0.1,7000,5,2024-01-01 00:00:00\n")
+        satellites = read_satellite_data_from_file(write_csv(text))
+
+        assert satellites[0]['raan'] == 0.0
+        assert satellites[0]['argument_of_perigee'] == 0.0
+
+    def test_missing_required_column(self, write_csv):
+        """Test a file without a required column raises ValueError."""
+        text = "name,id,inclination,eccentricity,semi_major_axis,epoch\nA,1,10,0.1,7000,2024-01-01 00:00:00\n"
+        with pytest.raises(ValueError, match="must contain columns"):
+            read_satellite_data_from_file(write_csv(text))
+
+    def test_no_valid_rows(self, write_csv):
+        """Test a file whose rows are all invalid raises ValueError."""
+        text = HEADER + "Bad,1,abc,0.1,7000,0,0,0,2024-01-01 00:00:00\n"
+        with pytest.raises(ValueError, match="No valid satellite data"):
+            read_satellite_data_from_file(write_csv(text))
+
+    def test_file_not_found(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            read_satellite_data_from_file(str(tmp_path / "missing.csv"))
+
+
+class TestWriteSatelliteSummary:
+    """Test class for write_satellite_summary_to_file."""
+
+    def test_summary_from_generator(self, tmp_path):
+        """Test the summary accepts a one-pass iterable of satellites."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        satellites = (Satellite(f"Sat{i}", str(i), 51.6, 0.001, 6778.0 + i, 0.0, epoch)
+                      for i in range(3))
+        path = tmp_path / "summary.csv"
+        write_satellite_summary_to_file(str(path), satellites)
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 4  # header + 3 satellites
+        assert lines[1] == "Sat0,0,51.6000,0.001000,6778.00,407.00,0.00"
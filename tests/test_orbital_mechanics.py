@@ -5,6 +5,8 @@ This module contains pytest tests for functions in orbital_mechanics.py.
 """
 
 import pytest
+import numpy as np
+from itertools import islice
 from datetime import datetime
 import sys
 import os
@@ -25,9 +27,10 @@ from satellite import Satellite
 class TestOrbitalMechanics:
     """Test class for orbital mechanics functions."""
     
-    @pytest.fixture
-    def sample_satellite(self):
-        """Create a sample satellite for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_satellite(cls):
+        """Create a sample satellite shared by the tests of the class (read-only)."""
         epoch = datetime(2024, 1, 1, 0, 0, 0)
         return Satellite(
             name="TestSat",
@@ -78,6 +81,23 @@ class TestOrbitalMechanics:
         elements = calculate_orbital_elements(tle_data)
         assert elements['semi_major_axis'] == 7000.0
     
+    def test_calculate_orbital_elements_epoch_formats(self):
+        """Test unpadded epochs are accepted and malformed epochs raise ValueError."""
+        tle_data = {
+            'inclination': 51.6,
+            'eccentricity': 0.001,
+            'semi_major_axis': 6778.0,
+            'mean_anomaly': 0.0,
+            'epoch': '2024-1-1 0:0:0'
+        }
+        elements = calculate_orbital_elements(tle_data)
+        assert elements['epoch'] == datetime(2024, 1, 1, 0, 0, 0)
+        
+        for epoch in ['2024-+1-01 00:00:00', '2024-01-01 -0:00:00',
+                      '2024-01-01 00:00:00 ', '2024-13-01 00:00:00', 'not a date']:
+            with pytest.raises(ValueError):
+                calculate_orbital_elements(dict(tle_data, epoch=epoch))
+    
     def test_calculate_orbital_elements_missing_field(self):
         """Test that missing required field raises ValueError."""
         incomplete_tle = {
@@ -116,6 +136,18 @@ class TestOrbitalMechanics:
         # Each position should be a tuple of 3 coordinates
         assert all(len(pos) == 3 for pos in positions)
     
+    def test_predict_future_positions_matches_calculate_position(self, sample_satellite):
+        """Test vectorized prediction agrees with the scalar position calculation."""
+        time_points, positions = predict_future_positions(
+            sample_satellite,
+            time_hours=2,
+            resolution_minutes=15
+        )
+        
+        for t, pos in zip(time_points, positions):
+            expected = sample_satellite.calculate_position(t)
+            assert pos == pytest.approx(expected, abs=1e-6)
+    
     def test_predict_future_positions_invalid_satellite(self):
         """Test that invalid satellite type raises TypeError."""
         with pytest.raises(TypeError):
@@ -137,18 +169,29 @@ class TestOrbitalMechanics:
             resolution_minutes=10
         )
         
-        # Get first few positions from generator
-        positions = []
-        count = 0
-        for time, pos in generator:
-            positions.append((time, pos))
-            count += 1
-            if count >= 4:  # Get 4 positions
-                break
+        # Get first 4 positions from generator
+        positions = list(islice(generator, 4))
         
         assert len(positions) == 4
         assert all(isinstance(pos, tuple) and len(pos) == 3 for _, pos in positions)
     
+    def test_generate_position_generator_chunks(self, sample_satellite):
+        """Test every chunk size yields the same time points and positions."""
+        for chunk_size in [1, 3, 7, 1024]:
+            positions = list(generate_position_generator(
+                sample_satellite, time_hours=1, resolution_minutes=5, chunk_size=chunk_size))
+            
+            # 0 to 60 minutes inclusive: 13 points, not a multiple of 3 or 7
+            assert [time for time, _ in positions] == [i * 300 for i in range(13)]
+            for time, pos in positions:
+                assert pos == pytest.approx(sample_satellite.calculate_position(time), abs=1e-6)
+    
+    def test_generate_position_generator_invalid_chunk_size(self, sample_satellite):
+        """Test that a chunk size below 1 raises ValueError."""
+        for chunk_size in [0, -1]:
+            with pytest.raises(ValueError, match="chunk_size"):
+                next(generate_position_generator(sample_satellite, chunk_size=chunk_size))
+    
     def test_generate_position_generator_invalid_satellite(self):
         """Test that generator raises TypeError for invalid satellite."""
         with pytest.raises(TypeError):
@@ -172,5 +215,13 @@ class TestOrbitalMechanics:
         assert velocity > 0
         # For low Earth orbit, velocity should be around 7-8 km/s
         assert 6 < velocity < 9
+    
+    def test_calculate_velocity_matches_position_radius(self, sample_satellite):
+        """Test velocity from the eccentric anomaly matches vis-viva at the position radius."""
+        for t in [0, 1200, 2700, 4000]:
+            x, y, z = sample_satellite.calculate_position(t)
+            r = np.sqrt(x**2 + y**2 + z**2)
+            expected = np.sqrt(398600.4418 * (2.0 / r - 1.0 / sample_satellite.semi_major_axis))
+            assert calculate_velocity(sample_satellite, t) == pytest.approx(expected, rel=1e-12)
 
 
@@ -6,6 +6,7 @@ constructor validation, position calculations, and operator overloading.
 """
 
 import pytest
+import numpy as np
 from datetime import datetime
 import sys
 import os
@@ -13,15 +14,16 @@ import os
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from satellite import Satellite
+from satellite import Satellite, SatelliteArray
 
 
 class TestSatellite:
     """Test class for Satellite functionality."""
     
-    @pytest.fixture
-    def sample_satellite(self):
-        """Create a sample satellite for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_satellite(cls):
+        """Create a sample satellite shared by the tests of the class (read-only)."""
         epoch = datetime(2024, 1, 1, 0, 0, 0)
         return Satellite(
             name="TestSat",
@@ -110,6 +112,44 @@ class TestSatellite:
                 argument_of_perigee=0.0
             )
     
+    def test_satellite_numpy_scalar_elements(self):
+        """Test that NumPy scalar elements are accepted and stored as floats."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        sat = Satellite("TestSat", "12345", np.float32(51.6), np.float64(0.001),
+                        np.int64(6771), 0.0, epoch)
+        
+        assert type(sat.semi_major_axis) is float
+        assert sat.semi_major_axis == 6771.0
+        
+        with pytest.raises(ValueError, match="Inclination"):
+            Satellite("TestSat", "12345", np.nan, 0.001, 6771, 0.0, epoch)
+    
+    def test_satellite_rejects_non_numeric_elements(self):
+        """Test that strings, bytes and booleans are rejected even though float() accepts them."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        
+        with pytest.raises(ValueError, match="Inclination"):
+            Satellite("TestSat", "12345", "51.6", 0.001, 6778.0, 0.0, epoch)
+        with pytest.raises(ValueError, match="Semi-major axis"):
+            Satellite("TestSat", "12345", 51.6, 0.001, b"6778", 0.0, epoch)
+        with pytest.raises(ValueError, match="Eccentricity"):
+            Satellite("TestSat", "12345", 51.6, False, 6778.0, 0.0, epoch)
+        
+        sat = Satellite("TestSat", "12345", 51.6, 0.001, 6778.0, 0.0, epoch)
+        with pytest.raises(ValueError, match="RAAN"):
+            sat.raan = "90"
+    
+    def test_satellite_rejects_non_finite_elements(self):
+        """Test that infinite or NaN elements raise ValueError."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        
+        with pytest.raises(ValueError, match="Semi-major axis"):
+            Satellite("TestSat", "12345", 51.6, 0.001, float('inf'), 0.0, epoch)
+        with pytest.raises(ValueError, match="Mean anomaly"):
+            Satellite("TestSat", "12345", 51.6, 0.001, 6778.0, float('inf'), epoch)
+        with pytest.raises(ValueError, match="Mean anomaly"):
+            Satellite("TestSat", "12345", 51.6, 0.001, 6778.0, np.nan, epoch)
+    
     def test_calculate_position(self, sample_satellite):
         """Test position calculation."""
         pos = sample_satellite.calculate_position(0)
@@ -124,6 +164,28 @@ class TestSatellite:
         with pytest.raises(ValueError, match="Time delta cannot be negative"):
             sample_satellite.calculate_position(-100)
     
+    def test_solve_kepler_equation(self):
+        """Test the eccentric anomaly satisfies Kepler's equation for any eccentricity."""
+        for eccentricity in [0.0, 0.001, 0.3, 0.72, 0.95, 0.999]:
+            sat = Satellite(
+                name="KeplerSat",
+                satellite_id="11111",
+                inclination=45.0,
+                eccentricity=eccentricity,
+                semi_major_axis=20000.0,
+                mean_anomaly=0.0,
+                epoch=datetime(2024, 1, 1, 0, 0, 0)
+            )
+            for M in np.linspace(0, 4 * np.pi, 37):
+                E = sat.solve_kepler_equation(M)
+                assert 0 <= E < 2 * np.pi + 1e-12
+                assert E - eccentricity * np.sin(E) == pytest.approx(M % (2 * np.pi), abs=1e-12)
+    
+    def test_solve_kepler_equation_legacy_keywords(self, sample_satellite):
+        """Test the tolerance and max_iterations keywords are still accepted."""
+        E = sample_satellite.solve_kepler_equation(1.0, tolerance=1e-6, max_iterations=5)
+        assert E == sample_satellite.solve_kepler_equation(1.0)
+    
     def test_get_altitude(self, sample_satellite):
         """Test altitude calculation."""
         altitude = sample_satellite.get_altitude()
@@ -195,3 +257,113 @@ class TestSatellite:
         with pytest.raises(TypeError):
             _ = sample_satellite > 123
 
+    
+    def test_calculate_positions_matches_scalar(self, sample_satellite):
+        """Test vectorized positions agree with the scalar calculation."""
+        times = [0, 600, 1800, 5400, 86400]
+        positions = sample_satellite.calculate_positions(times)
+        
+        assert positions.shape == (len(times), 3)
+        for t, pos in zip(times, positions):
+            expected = sample_satellite.calculate_position(t)
+            assert pos == pytest.approx(expected, abs=1e-6)
+    
+    def test_calculate_positions_negative_time(self, sample_satellite):
+        """Test that negative times raise ValueError in the vectorized path."""
+        with pytest.raises(ValueError, match="Time delta cannot be negative"):
+            sample_satellite.calculate_positions([0, -100])
+    
+    def test_calculate_positions_table(self, sample_satellite):
+        """Test the Kepler lookup table stays close to the exact solution."""
+        times = np.linspace(0, 86400, 1001)
+        exact = sample_satellite.calculate_positions(times)
+        approx = sample_satellite.calculate_positions(times, use_table=True)
+        
+        assert approx.shape == exact.shape
+        assert np.abs(approx - exact).max() < 0.1  # km
+    
+    def test_calculate_positions_table_high_eccentricity(self):
+        """Test the Kepler lookup table is refined for highly eccentric orbits."""
+        for eccentricity in [0.72, 0.95, 0.99]:
+            sat = Satellite(
+                name="EccentricSat",
+                satellite_id="22222",
+                inclination=63.4,
+                eccentricity=eccentricity,
+                semi_major_axis=26600.0,
+                mean_anomaly=0.0,
+                epoch=datetime(2024, 1, 1, 0, 0, 0),
+                raan=120.0,
+                argument_of_perigee=270.0
+            )
+            # Dense sampling so points land close to perigee
+            times = np.linspace(0, 2 * 43200, 100001)
+            exact = sat.calculate_positions(times)
+            approx = sat.calculate_positions(times, use_table=True)
+            
+            assert np.abs(approx - exact).max() < 4e-6 * sat.semi_major_axis
+    
+    def test_calculate_positions_float32(self, sample_satellite):
+        """Test single-precision positions stay close to the float64 result."""
+        times = np.linspace(0, 7 * 86400, 2001)
+        exact = sample_satellite.calculate_positions(times)
+        single = sample_satellite.calculate_positions(times, dtype=np.float32)
+        
+        assert single.dtype == np.float32
+        assert np.abs(single - exact).max() < 0.1  # km
+    
+    def test_satellite_array_matches_per_satellite(self, sample_satellite):
+        """Test batched propagation of several satellites matches each one alone."""
+        eccentric_sat = Satellite(
+            name="Molniya",
+            satellite_id="67890",
+            inclination=63.4,
+            eccentricity=0.72,
+            semi_major_axis=26600.0,
+            mean_anomaly=30.0,
+            epoch=datetime(2024, 1, 1, 0, 0, 0),
+            raan=120.0,
+            argument_of_perigee=270.0
+        )
+        satellites = [sample_satellite, eccentric_sat]
+        times = np.array([0, 600, 1800, 5400])
+        positions = SatelliteArray(satellites).propagate(times)
+        
+        assert positions.shape == (len(satellites), len(times), 3)
+        for sat, sat_positions in zip(satellites, positions):
+            expected = sat.calculate_positions(times)
+            assert sat_positions == pytest.approx(expected, abs=1e-6)
+    
+    def test_propagate_many(self, sample_satellite):
+        """Test propagate_many returns one trajectory per satellite."""
+        times = [0, 600, 1800]
+        positions = Satellite.propagate_many([sample_satellite, sample_satellite], times)
+        
+        assert positions.shape == (2, len(times), 3)
+        assert positions[1] == pytest.approx(sample_satellite.calculate_positions(times), abs=1e-6)
+        with pytest.raises(ValueError):
+            Satellite.propagate_many([], times)
+    
+    def test_reassigned_elements_refresh_cached_values(self):
+        """Test that reassigning elements updates the getters and the positions."""
+        epoch = datetime(2024, 1, 1, 0, 0, 0)
+        sat = Satellite("TestSat", "12345", 51.6, 0.001, 6778.0, 0.0, epoch)
+        times = np.array([0, 600, 1800, 5400])
+        sat.calculate_positions(times, use_table=True)  # build the lookup table
+        
+        sat.semi_major_axis = 42164
+        sat.eccentricity = 0.2
+        sat.raan = 90.0
+        expected = Satellite("TestSat", "12345", 51.6, 0.2, 42164.0, 0.0, epoch, raan=90.0)
+        
+        assert sat.get_altitude() == expected.get_altitude()
+        assert sat.get_perigee_altitude() == expected.get_perigee_altitude()
+        assert sat.get_apogee_altitude() == expected.get_apogee_altitude()
+        assert sat.calculate_position(600) == pytest.approx(expected.calculate_position(600), abs=1e-9)
+        assert sat.calculate_positions(times) == pytest.approx(expected.calculate_positions(times), abs=1e-9)
+        assert sat.calculate_positions(times, use_table=True) == pytest.approx(
+            expected.calculate_positions(times, use_table=True), abs=1e-9)
+        
+        with pytest.raises(ValueError, match="Eccentricity"):
+            sat.eccentricity = 1.5
+        assert sat.eccentricity == 0.2
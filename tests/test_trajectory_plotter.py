@@ -0,0 +1,113 @@
+"""
+Test module for TrajectoryPlotter class.
+
+This module contains pytest tests for the TrajectoryPlotter class,
+focusing on the positions it propagates for plotting.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+import sys
+import os
+
+import matplotlib
+matplotlib.use('Agg')  # No display needed for tests
+import matplotlib.pyplot as plt
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from satellite import Satellite, EARTH_RADIUS_KM
+from trajectory_plotter import TrajectoryPlotter
+
+
+class TestTrajectoryPlotter:
+    """Test class for TrajectoryPlotter functionality."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_satellite(cls):
+        """Create a sample satellite shared by the tests of the class (read-only)."""
+        return Satellite(
+            name="TestSat",
+            satellite_id="12345",
+            inclination=51.6,
+            eccentricity=0.001,
+            semi_major_axis=6778.0,
+            mean_anomaly=0.0,
+            epoch=datetime(2024, 1, 1, 0, 0, 0)
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def geo_satellite(cls):
+        """Create a geostationary satellite shared by the tests of the class."""
+        return Satellite(
+            name="GeoSat",
+            satellite_id="54321",
+            inclination=0.0,
+            eccentricity=0.0,
+            semi_major_axis=42164.0,
+            mean_anomaly=0.0,
+            epoch=datetime(2024, 1, 1, 0, 0, 0)
+        )
+
+    def test_invalid_satellite(self, sample_satellite):
+        """Test that a non-Satellite raises TypeError, also on reassignment."""
+        with pytest.raises(TypeError):
+            TrajectoryPlotter("not a satellite")
+
+        plotter = TrajectoryPlotter(sample_satellite)
+        with pytest.raises(TypeError):
+            plotter.satellite = "not a satellite"
+
+    def test_reassigned_satellite_not_served_from_cache(self, sample_satellite, geo_satellite):
+        """Test that switching satellites does not reuse the old cached positions."""
+        plotter = TrajectoryPlotter(sample_satellite)
+        time_points = np.arange(0, 3600, 60.0)
+
+        plotter.plot_altitude_over_time(time_points)
+        altitudes = plotter.ax.get_lines()[0].get_ydata()
+        assert altitudes.max() < 1000
+        plt.close(plotter.fig)
+
+        plotter.satellite = geo_satellite
+        plotter.plot_altitude_over_time(time_points)
+        altitudes = plotter.ax.get_lines()[0].get_ydata()
+        assert altitudes == pytest.approx(42164.0 - EARTH_RADIUS_KM, abs=1e-6)
+        plt.close(plotter.fig)
+
+    def test_multiple_3d_trajectories_precision(self, sample_satellite, geo_satellite):
+        """Test the fast and exact multi-satellite plots draw the same trajectories."""
+        satellites = [sample_satellite, geo_satellite]
+        time_points = np.arange(0, 7200, 60.0)
+        lines = {}
+        for precision in ('exact', 'fast'):
+            fig = TrajectoryPlotter.plot_multiple_3d_trajectories(
+                satellites, time_points, show_earth=False, precision=precision)
+            lines[precision] = [np.array(line.get_data_3d()) for line in fig.axes[0].get_lines()]
+            plt.close(fig)
+
+        assert len(lines['fast']) == len(satellites)
+        for exact, fast in zip(lines['exact'], lines['fast']):
+            assert np.abs(fast - exact).max() < 0.2  # km
+
+        with pytest.raises(ValueError, match="precision"):
+            TrajectoryPlotter.plot_multiple_3d_trajectories(satellites, time_points, precision='rough')
+
+    def test_reassigned_element_not_served_from_cache(self):
+        """Test that changing an orbital element does not reuse the old cached positions."""
+        sat = Satellite("TestSat", "12345", 51.6, 0.001, 6778.0, 0.0, datetime(2024, 1, 1, 0, 0, 0))
+        plotter = TrajectoryPlotter(sat)
+        time_points = np.arange(0, 3600, 60.0)
+
+        plotter.plot_altitude_over_time(time_points)
+        plt.close(plotter.fig)
+
+        sat.semi_major_axis = 42164.0
+        sat.eccentricity = 0.0
+        plotter.plot_altitude_over_time(time_points)
+        altitudes = plotter.ax.get_lines()[0].get_ydata()
+        assert altitudes == pytest.approx(42164.0 - EARTH_RADIUS_KM, abs=1e-6)
+        plt.close(plotter.fig)
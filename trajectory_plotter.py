@@ -5,9 +5,11 @@ This module provides the TrajectoryPlotter class which uses composition
 to work with Satellite objects and creates various types of plots.
 """
 
+from functools import lru_cache
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
-from satellite import Satellite
+from satellite import Satellite, EARTH_RADIUS_KM
 
 
 class TrajectoryPlotter:
@@ -24,6 +26,9 @@ class TrajectoryPlotter:
         ax (matplotlib.axes.Axes): Matplotlib axes object
     """
     
+    # Maximum number of time arrays whose positions are kept per plotter
+    _POSITION_CACHE_SIZE = 8
+    
     def __init__(self, satellite):
         """
         Initialize a TrajectoryPlotter with a Satellite object.
@@ -36,13 +41,123 @@ class TrajectoryPlotter:
         Raises:
             TypeError: If satellite is not a Satellite instance
         """
-        if not isinstance(satellite, Satellite):
-            raise TypeError("satellite must be a Satellite instance")
+        self._position_cache = {}
         self.satellite = satellite
         self.fig = None
         self.ax = None
     
-    def plot_2d_trajectory(self, time_points, show_earth=True):
+    @property
+    def satellite(self):
+        """Satellite: The satellite object to plot."""
+        return self._satellite
+    
+    @satellite.setter
+    def satellite(self, satellite):
+        """
+        Set the satellite to plot and drop positions cached for the old one.
+        
+        Args:
+            satellite (Satellite): The satellite to plot
+            
+        Raises:
+            TypeError: If satellite is not a Satellite instance
+        """
+        if not isinstance(satellite, Satellite):
+            raise TypeError("satellite must be a Satellite instance")
+        self._satellite = satellite
+        self._position_cache.clear()
+    
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _get_earth_mesh(cls, radius=EARTH_RADIUS_KM, n=50):
+        """
+        Build the Earth sphere mesh used by the 3D plots, with memoization.
+        
+        The mesh does not depend on the satellite, so it is computed once per
+        (radius, n) and shared by every plot.
+        
+        Args:
+            radius (float): Sphere radius in km
+            n (int): Number of points along each angular direction
+        
+        Returns:
+            tuple: Read-only (x, y, z) arrays of shape (n, n)
+        """
+        u = np.linspace(0, 2 * np.pi, n)
+        v = np.linspace(0, np.pi, n)
+        sin_v = radius * np.sin(v)
+        x_earth = np.outer(np.cos(u), sin_v)
+        y_earth = np.outer(np.sin(u), sin_v)
+        # z only varies along v, so broadcast one row instead of an outer product
+        z_earth = np.broadcast_to(radius * np.cos(v), (n, n))
+        for mesh in (x_earth, y_earth):
+            mesh.setflags(write=False)  # Shared between plots
+        return x_earth, y_earth, z_earth
+    
+    def _get_positions(self, time_points, precision='exact'):
+        """
+        Return the satellite positions at time_points, with memoization.
+        
+        Plotting the same time points several times (e.g. the 2D, 3D and
+        altitude plots of one dashboard) propagates the orbit only once.
+        
+        Args:
+            time_points (array-like): Time deltas in seconds from epoch
+            precision (str): 'exact' to solve Kepler's equation at every point,
+                or 'fast' to interpolate the satellite's precomputed Kepler
+                table (error below about 4e-6 of the semi-major axis up to
+                e = 0.99; see Satellite.calculate_positions)
+        
+        Returns:
+            numpy.ndarray: Read-only array of shape (N, 3) with ECI positions
+        
+        Raises:
+            ValueError: If precision is not 'exact' or 'fast'
+        """
+        if precision not in ('exact', 'fast'):
+            raise ValueError("precision must be 'exact' or 'fast'")
+        
+        time_points = np.asarray(time_points, dtype=np.float64)
+        # The elements are part of the key since they can be reassigned
+        sat = self.satellite
+        elements = (sat.inclination, sat.eccentricity, sat.semi_major_axis,
+                    sat.mean_anomaly, sat.raan, sat.argument_of_perigee)
+        key = (precision, elements, time_points.shape, time_points.tobytes())
+        positions = self._position_cache.get(key)
+        if positions is None:
+            positions = self.satellite.calculate_positions(
+                time_points, use_table=(precision == 'fast'))
+            positions.setflags(write=False)  # Shared between plots
+            if len(self._position_cache) >= self._POSITION_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._position_cache[next(iter(self._position_cache))]
+            self._position_cache[key] = positions
+        return positions
+    
+    @staticmethod
+    def _prepare_axes(ax, figsize, projection=None):
+        """
+        Return a cleared figure and axes to draw on.
+        
+        Reusing the axes of a previous plot avoids allocating a new Figure,
+        Axes and canvas when the same view is redrawn with new data.
+        
+        Args:
+            ax (matplotlib.axes.Axes or None): Axes to reuse, or None to create
+                a new figure
+            figsize (tuple): Size of a newly created figure in inches
+            projection (str): Projection of newly created axes (e.g. '3d')
+        
+        Returns:
+            tuple: (figure, axes)
+        """
+        if ax is None:
+            fig = plt.figure(figsize=figsize)
+            return fig, fig.add_subplot(111, projection=projection)
+        ax.clear()
+        return ax.figure, ax
+    
+    def plot_2d_trajectory(self, time_points, show_earth=True, precision='exact', ax=None):
         """
         Plot a smooth 2D trajectory projection in the XY plane.
         
@@ -50,6 +165,8 @@ class TrajectoryPlotter:
             time_points (list): List of time deltas in seconds from epoch
             show_earth (bool): Whether to show Earth as a circle
             smooth (bool): Whether to use interpolation for smooth curve
+            precision (str): 'exact' or 'fast' Kepler solution (see _get_positions)
+            ax (matplotlib.axes.Axes): Axes to redraw on instead of a new figure
             
         Returns:
             matplotlib.figure.Figure: The figure object
@@ -57,30 +174,38 @@ class TrajectoryPlotter:
         Raises:
             ValueError: If time_points is empty or invalid
         """
-        if not time_points or len(time_points) == 0:
+        if time_points is None or len(time_points) == 0:
             raise ValueError("time_points cannot be empty")
         
-        # Calculate positions for all time points using a for loop
-        positions = []
-        for t in time_points:
-            try:
-                pos = self.satellite.calculate_position(t)
-                positions.append(pos)
-            except ValueError as e:
-                print(f"Warning: Skipping invalid time point {t}: {e}")
-                continue
-        
-        if not positions:
-            raise ValueError("No valid positions calculated")
+        # Drop negative or non-finite time points with one mask, then
+        # propagate the rest in one call
+        time_points = np.asarray(time_points, dtype=np.float64)
+        valid = np.isfinite(time_points) & (time_points >= 0)
+        if not valid.all():
+            if not valid.any():
+                raise ValueError("No valid positions calculated")
+            invalid_count = len(valid) - np.count_nonzero(valid)
+            print(f"Warning: Skipping {invalid_count} invalid time point(s): "
+                  f"time deltas must be finite and non-negative")
+            time_points = time_points[valid]
         
-        positions = np.array(positions)
+        positions = self._get_positions(time_points, precision)
         
         # Create figure and axes
-        self.fig, self.ax = plt.subplots(figsize=(10, 10))
+        self.fig, self.ax = self._prepare_axes(ax, figsize=(10, 10))
+        
+        # Fix square limits up front so adding artists skips autoscaling
+        bound = np.abs(positions[:, :2]).max()
+        if show_earth:
+            bound = max(bound, EARTH_RADIUS_KM)
+        bound *= 1.1
+        self.ax.set_xlim(-bound, bound)
+        self.ax.set_ylim(-bound, bound)
+        self.ax.set_aspect('equal', adjustable='box')
         
         # Plot trajectory with smooth line
         self.ax.plot(positions[:, 0], positions[:, 1], 'b-', linewidth=2.5, 
-                    label=f'{self.satellite.name} Trajectory', alpha=0.8, linestyle='-')
+                    label=f'{self.satellite.name} Trajectory', alpha=0.8)
         
         # Mark start and end points
         self.ax.plot(positions[0, 0], positions[0, 1], 'go', 
@@ -90,9 +215,9 @@ class TrajectoryPlotter:
         
         # Show Earth if requested
         if show_earth:
-            earth_radius = 6371  # km
-            circle = plt.Circle((0, 0), earth_radius, color='lightblue', 
-                              alpha=0.4, label='Earth', edgecolor='blue', linewidth=2.5)
+            # color sets both face and edge; a separate edgecolor was ignored
+            circle = plt.Circle((0, 0), EARTH_RADIUS_KM, color='lightblue',
+                              alpha=0.4, label='Earth', linewidth=2.5)
             self.ax.add_patch(circle)
         
         # Set labels and title
@@ -102,34 +227,30 @@ class TrajectoryPlotter:
                          fontsize=14, fontweight='bold')
         self.ax.legend(loc='upper right', fontsize=10)
         self.ax.grid(True, alpha=0.3, linestyle='--')
-        self.ax.set_aspect('equal')
         
         return self.fig
     
-    def plot_3d_trajectory(self, time_points):
+    def plot_3d_trajectory(self, time_points, sphere_resolution=24, precision='exact',
+                           show_earth=True, ax=None):
         """
         Plot a smooth 3D trajectory visualization.
         
         Args:
             time_points (list): List of time deltas in seconds from epoch
             smooth (bool): Whether to use more points for smoother curve
+            sphere_resolution (int): Points along each direction of the Earth mesh
+            precision (str): 'exact' or 'fast' Kepler solution (see _get_positions)
+            show_earth (bool): Whether to show Earth as a sphere
+            ax (matplotlib.axes.Axes): 3D axes to redraw on instead of a new figure
             
         Returns:
             matplotlib.figure.Figure: The figure object
         """
-        from mpl_toolkits.mplot3d import Axes3D
-        
-        # Calculate positions
-        positions = []
-        for t in time_points:
-            pos = self.satellite.calculate_position(t)
-            positions.append(pos)
-        
-        positions = np.array(positions)
+        # Calculate all positions at once
+        positions = self._get_positions(time_points, precision)
         
         # Create 3D figure
-        self.fig = plt.figure(figsize=(14, 12))
-        self.ax = self.fig.add_subplot(111, projection='3d')
+        self.fig, self.ax = self._prepare_axes(ax, figsize=(14, 12), projection='3d')
         
         # Plot smooth trajectory (positions already calculated with good resolution)
         self.ax.plot(positions[:, 0], positions[:, 1], positions[:, 2], 
@@ -141,15 +262,11 @@ class TrajectoryPlotter:
         self.ax.scatter(positions[-1, 0], positions[-1, 1], positions[-1, 2], 
                        color='red', s=200, label='End', zorder=5, edgecolors='darkred', linewidth=2)
         
-        # Show Earth as a sphere
-        earth_radius = 6371
-        u = np.linspace(0, 2 * np.pi, 50)
-        v = np.linspace(0, np.pi, 50)
-        x_earth = earth_radius * np.outer(np.cos(u), np.sin(v))
-        y_earth = earth_radius * np.outer(np.sin(u), np.sin(v))
-        z_earth = earth_radius * np.outer(np.ones(np.size(u)), np.cos(v))
-        self.ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.25, 
-                           color='lightblue', edgecolor='none', linewidth=0)
+        # Show Earth as a sphere if requested
+        if show_earth:
+            x_earth, y_earth, z_earth = TrajectoryPlotter._get_earth_mesh(n=sphere_resolution)
+            self.ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.25, rstride=1, cstride=1,
+                               color='lightblue', edgecolor='none', linewidth=0)
         
         # Set labels and title
         self.ax.set_xlabel('X (km)', fontsize=12, fontweight='bold')
@@ -162,7 +279,9 @@ class TrajectoryPlotter:
         return self.fig
     
     @staticmethod
-    def plot_multiple_3d_trajectories(satellites, time_points, colors=None, labels=None):
+    def plot_multiple_3d_trajectories(satellites, time_points, colors=None, labels=None,
+                                      sphere_resolution=24, show_earth=True, ax=None,
+                                      precision='exact'):
         """
         Plot multiple satellite trajectories in the same 3D plot for comparison.
         
@@ -171,14 +290,21 @@ class TrajectoryPlotter:
             time_points (list): List of time deltas in seconds from epoch
             colors (list): Optional list of colors for each satellite
             labels (list): Optional list of labels (uses satellite names if None)
+            sphere_resolution (int): Points along each direction of the Earth mesh
+            show_earth (bool): Whether to show Earth as a sphere
+            ax (matplotlib.axes.Axes): 3D axes to redraw on instead of a new figure
+            precision (str): 'exact' or 'fast' Kepler solution (see _get_positions)
         
         Returns:
             matplotlib.figure.Figure: The figure object
-        """
-        from mpl_toolkits.mplot3d import Axes3D
         
+        Raises:
+            ValueError: If satellites is empty or precision is invalid
+        """
         if not satellites:
             raise ValueError("At least one satellite must be provided")
+        if precision not in ('exact', 'fast'):
+            raise ValueError("precision must be 'exact' or 'fast'")
         
         # Default colors
         if colors is None:
@@ -189,19 +315,18 @@ class TrajectoryPlotter:
             labels = [sat.name for sat in satellites]
         
         # Create 3D figure
-        fig = plt.figure(figsize=(16, 12))
-        ax = fig.add_subplot(111, projection='3d')
+        fig, ax = TrajectoryPlotter._prepare_axes(ax, figsize=(16, 12), projection='3d')
+        
+        if precision == 'fast':
+            # Each satellite interpolates its own Kepler table
+            all_positions = [sat.calculate_positions(time_points, use_table=True)
+                             for sat in satellites]
+        else:
+            # Propagate every satellite at every time point in one call
+            all_positions = Satellite.propagate_many(satellites, time_points)
         
         # Plot each satellite trajectory
-        for idx, satellite in enumerate(satellites):
-            # Calculate positions
-            positions = []
-            for t in time_points:
-                pos = satellite.calculate_position(t)
-                positions.append(pos)
-            
-            positions = np.array(positions)
-            
+        for idx, positions in enumerate(all_positions):
             # Plot smooth trajectory (positions already calculated with good resolution)
             color = colors[idx % len(colors)]
             ax.plot(positions[:, 0], positions[:, 1], positions[:, 2], '-',
@@ -211,15 +336,11 @@ class TrajectoryPlotter:
             ax.scatter(positions[0, 0], positions[0, 1], positions[0, 2],
                       color=color, s=150, marker='o', zorder=5, alpha=0.9, edgecolors='black', linewidth=1.5)
         
-        # Show Earth as a sphere
-        earth_radius = 6371
-        u = np.linspace(0, 2 * np.pi, 50)
-        v = np.linspace(0, np.pi, 50)
-        x_earth = earth_radius * np.outer(np.cos(u), np.sin(v))
-        y_earth = earth_radius * np.outer(np.sin(u), np.sin(v))
-        z_earth = earth_radius * np.outer(np.ones(np.size(u)), np.cos(v))
-        ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.2, 
-                       color='lightblue', edgecolor='none', linewidth=0)
+        # Show Earth as a sphere if requested
+        if show_earth:
+            x_earth, y_earth, z_earth = TrajectoryPlotter._get_earth_mesh(n=sphere_resolution)
+            ax.plot_surface(x_earth, y_earth, z_earth, alpha=0.2, rstride=1, cstride=1,
+                           color='lightblue', edgecolor='none', linewidth=0)
         
         # Set labels and title
         ax.set_xlabel('X (km)', fontsize=12, fontweight='bold')
@@ -231,30 +352,28 @@ class TrajectoryPlotter:
         
         return fig
     
-    def plot_altitude_over_time(self, time_points):
+    def plot_altitude_over_time(self, time_points, precision='exact', ax=None):
         """
         Plot satellite altitude over time.
         
         Args:
             time_points (list): List of time deltas in seconds from epoch
+            precision (str): 'exact' or 'fast' Kepler solution (see _get_positions)
+            ax (matplotlib.axes.Axes): Axes to redraw on instead of a new figure
             
         Returns:
             matplotlib.figure.Figure: The figure object
         """
         # Calculate positions and convert to altitudes
-        altitudes = []
-        times_hours = []
-        
-        for t in time_points:
-            pos = self.satellite.calculate_position(t)
-            # Calculate distance from origin (altitude + Earth radius)
-            distance = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
-            altitude = distance - 6371  # Subtract Earth radius
-            altitudes.append(altitude)
-            times_hours.append(t / 3600)  # Convert to hours
+        time_points = np.asarray(time_points, dtype=np.float64)
+        positions = self._get_positions(time_points, precision)
+        # Distance from origin minus Earth radius, in place in the norm's output
+        altitudes = np.linalg.norm(positions, axis=1)
+        altitudes -= EARTH_RADIUS_KM
+        times_hours = time_points * (1.0 / 3600.0)  # Convert to hours
         
         # Create figure
-        self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        self.fig, self.ax = self._prepare_axes(ax, figsize=(10, 6))
         
         # Plot altitude
         self.ax.plot(times_hours, altitudes, 'b-', linewidth=2, label='Altitude')